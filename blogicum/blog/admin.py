@@ -1,6 +1,45 @@
 from django.contrib import admin
 
 from .models import Category, Location, Post, Comment
+from .paginators import EstimatedCountPaginator
+from .search import get_search_backend
+from .signals import deferred_comment_counts
+
+
+class InputFilter(admin.SimpleListFilter):
+    template = 'admin/input_filter.html'
+
+    def lookups(self, request, model_admin):
+        return ((),)
+
+    def choices(self, changelist):
+        all_choice = next(super().choices(changelist))
+        all_choice['query_parts'] = (
+            (name, value)
+            for name, value in changelist.get_filters_params().items()
+            if name != self.parameter_name
+        )
+        yield all_choice
+
+
+class AuthorFilter(InputFilter):
+    title = 'автору'
+    parameter_name = 'author'
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(author__username=self.value().strip())
+
+
+class PostFilter(InputFilter):
+    title = 'номеру публикации'
+    parameter_name = 'post'
+
+    def queryset(self, request, queryset):
+        if self.value():
+            if not self.value().strip().isdigit():
+                return queryset.none()
+            return queryset.filter(post_id=int(self.value()))
 
 
 @admin.register(Category)
@@ -28,7 +67,12 @@ class PostAdmin(admin.ModelAdmin):
                     'pub_date',
                     'is_published',
                     'category',
-                    'location')
+                    'location',
+                    'comment_count')
+    list_select_related = ('author', 'category', 'location')
+    autocomplete_fields = ('author', 'category', 'location')
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
     search_fields = (
         'title',
         'text',
@@ -40,11 +84,27 @@ class PostAdmin(admin.ModelAdmin):
                    'pub_date',
                    'category',
                    'location',
-                   'author')
+                   AuthorFilter)
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term:
+            return queryset, False
+        return get_search_backend().search(queryset, search_term), False
 
 
 @admin.register(Comment)
 class CommentAdmin(admin.ModelAdmin):
     list_display = ('post', 'author', 'text', 'created_at')
+    list_select_related = ('post', 'author')
+    raw_id_fields = ('post',)
+    autocomplete_fields = ('author',)
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
     search_fields = ('text', 'author__username', 'post__title')
-    list_filter = ('created_at', 'post', 'author')
+    list_filter = ('created_at', PostFilter, AuthorFilter)
+
+    def delete_queryset(self, request, queryset):
+        with deferred_comment_counts(
+            queryset.values_list('post_id', flat=True)
+        ):
+            super().delete_queryset(request, queryset)
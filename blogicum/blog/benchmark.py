@@ -0,0 +1,215 @@
+import statistics
+import time
+import tracemalloc
+from itertools import count
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import connection
+from django.template import Context, Engine, engines
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from .constants import PAGINATE_BY
+from .models import Post
+from .paginators import encode_cursor
+from .views import process_posts
+
+TEMPLATE_LOADERS = [
+    'django.template.loaders.filesystem.Loader',
+    'django.template.loaders.app_directories.Loader',
+]
+
+DEFAULT_BUDGETS = {
+    'index': {'queries': 5, 'p95_ms': 200},
+    'index_deep_page': {'queries': 5, 'p95_ms': 300},
+    'index_deep_cursor': {'queries': 4, 'p95_ms': 200},
+    'category_posts': {'queries': 6, 'p95_ms': 200},
+    'profile': {'queries': 6, 'p95_ms': 200},
+    'post_detail': {'queries': 6, 'p95_ms': 200},
+    'create_post': {'queries': 9, 'p95_ms': 200},
+    'edit_post': {'queries': 11, 'p95_ms': 200},
+    'add_comment': {'queries': 8, 'p95_ms': 200},
+}
+
+
+def get_scenarios():
+    feed = Post.objects.filter(
+        is_published=True,
+        category__is_published=True,
+        pub_date__lte=timezone.now()
+    )
+    last_page = max(1, feed.count() // PAGINATE_BY)
+    deep_post = feed.order_by('-pub_date', '-pk')[
+        (last_page - 1) * PAGINATE_BY
+    ]
+    post = feed.order_by('-comment_count').select_related(
+        'author', 'category'
+    ).first()
+    author = post.author
+    comment_number = count()
+    return author, {
+        'index': ('get', '/', None),
+        'index_deep_page': ('get', f'/?page={last_page}', None),
+        'index_deep_cursor': (
+            'get', f'/?cursor={encode_cursor("n", deep_post)}', None
+        ),
+        'category_posts': ('get', f'/category/{post.category.slug}/', None),
+        'profile': ('get', f'/profile/{author.username}/', None),
+        'post_detail': ('get', f'/posts/{post.pk}/', None),
+        'create_post': ('post', '/posts/create/', lambda: {
+            'title': 'Новая публикация',
+            'text': 'Текст',
+            'pub_date': timezone.now().strftime('%Y-%m-%d %H:%M'),
+            'category': post.category_id,
+            'location': post.location_id,
+            'is_published': 'on',
+        }),
+        'edit_post': ('post', f'/posts/{post.pk}/edit/', lambda: {
+            'title': post.title,
+            'text': post.text,
+            'pub_date': post.pub_date.strftime('%Y-%m-%d %H:%M'),
+            'category': post.category_id,
+            'location': post.location_id,
+            'is_published': 'on',
+        }),
+        'add_comment': ('post', f'/posts/{post.pk}/add_comment/', lambda: {
+            'text': f'Комментарий {next(comment_number)}',
+        }),
+    }
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def summarize(timings):
+    return {
+        'p50_ms': round(statistics.median(timings), 2),
+        'p95_ms': round(percentile(timings, 0.95), 2),
+        'mean_ms': round(statistics.mean(timings), 2),
+    }
+
+
+def measure(client, method, url, data, iterations, cold):
+    request = getattr(client, method)
+    timings = []
+    with CaptureQueriesContext(connection) as queries:
+        response = request(url, data() if data else None)
+    query_count = len(queries)
+    for _ in range(iterations):
+        if cold:
+            cache.clear()
+        started = time.perf_counter()
+        request(url, data() if data else None)
+        timings.append((time.perf_counter() - started) * 1000)
+    tracemalloc.start()
+    request(url, data() if data else None)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'status': response.status_code,
+        'queries': query_count,
+        **summarize(timings),
+        'peak_kib': round(peak / 1024, 1),
+    }
+
+
+def check_budgets(results, budgets):
+    failures = [
+        f'{view}: status = {result["status"]}'
+        for view, result in results.items()
+        if result.get('status', 200) >= 400
+    ]
+    for view, budget in budgets.items():
+        for metric, limit in budget.items():
+            value = results.get(view, {}).get(metric)
+            if value is not None and value > limit:
+                failures.append(f'{view}: {metric} = {value} > {limit}')
+    return failures
+
+
+def template_engine(cached):
+    base = engines['django'].engine
+    loaders = TEMPLATE_LOADERS
+    if cached:
+        loaders = [('django.template.loaders.cached.Loader', loaders)]
+    return Engine(dirs=base.dirs, loaders=loaders, libraries=base.libraries)
+
+
+def measure_render(template_name, context, iterations, cached):
+    engine = template_engine(cached)
+    engine.get_template(template_name).render(Context(context))
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        engine.get_template(template_name).render(Context(context))
+        timings.append((time.perf_counter() - started) * 1000)
+    return summarize(timings)
+
+
+def run_render_benchmarks(iterations=20):
+    page_obj = Paginator(
+        list(process_posts().order_by('-pub_date')[:PAGINATE_BY]),
+        PAGINATE_BY
+    ).get_page(1)
+    return {
+        f'render_index_{mode}': measure_render(
+            'blog/index.html', {'page_obj': page_obj}, iterations,
+            cached=mode == 'cached'
+        )
+        for mode in ('uncached', 'cached')
+    }
+
+
+def count_session_queries(client, url):
+    statements = []
+
+    def record(execute, sql, params, many, context):
+        statements.append(sql)
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(record):
+        client.get(url)
+    return sum('django_session' in sql for sql in statements)
+
+
+def run_session_benchmarks(author, iterations=20):
+    results = {}
+    for name, engine in settings.SESSION_ENGINES.items():
+        with override_settings(SESSION_ENGINE=engine):
+            authenticated = Client()
+            authenticated.force_login(author)
+            for kind, client in (
+                ('anonymous', Client()),
+                ('authenticated', authenticated),
+            ):
+                client.get('/')
+                results[f'session_{name}_{kind}'] = {
+                    **measure(client, 'get', '/', None, iterations, False),
+                    'session_queries': count_session_queries(client, '/'),
+                }
+            authenticated.logout()
+    return results
+
+
+def run_benchmarks(iterations=20, cold=False, views=None):
+    author, scenarios = get_scenarios()
+    client = Client()
+    client.force_login(author)
+    results = {}
+    with override_settings(DEBUG=False, ALLOWED_HOSTS=['testserver']):
+        for view, (method, url, data) in scenarios.items():
+            if views and view not in views:
+                continue
+            results[view] = measure(
+                client, method, url, data, iterations, cold
+            )
+        if not views:
+            results.update(run_session_benchmarks(author, iterations))
+    if not views:
+        results.update(run_render_benchmarks(iterations))
+    return results
@@ -0,0 +1,153 @@
+from functools import wraps
+from hashlib import md5
+from http import HTTPStatus
+from uuid import uuid4
+
+from django.conf import settings
+from django.contrib.auth import (BACKEND_SESSION_KEY, HASH_SESSION_KEY,
+                                 SESSION_KEY, get_user)
+from django.core.cache import cache
+from django.db.models import Max
+from django.utils import timezone
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.views.decorators.http import condition
+
+from .constants import USER_CACHE_TIMEOUT
+from .models import Post
+
+VERSION_KEY = 'blog:version:{}:{}'
+USER_KEY = 'blog:user:{}:{}:{}'
+
+
+def version_key(kind, pk):
+    return VERSION_KEY.format(kind, pk)
+
+
+def get_versions(*scopes):
+    keys = [version_key(*scope) for scope in scopes]
+    versions = cache.get_many(keys)
+    missing = {key: uuid4().hex for key in keys if key not in versions}
+    if missing:
+        cache.set_many(missing, None)
+        versions.update(missing)
+    return [versions[key] for key in keys]
+
+
+def bump_versions(*scopes):
+    cache.set_many(
+        {version_key(*scope): uuid4().hex for scope in scopes}, None
+    )
+
+
+def get_card_version(post):
+    return '.'.join(get_versions(
+        ('post', post.pk),
+        ('user', post.author_id),
+        ('category', post.category_id),
+        ('location', post.location_id),
+    ))
+
+
+def get_page_validator(request, scope):
+    validators = request.__dict__.setdefault('_page_validators', {})
+    if scope not in validators:
+        latest = Post.objects.filter(
+            is_published=True, pub_date__lte=timezone.now()
+        ).aggregate(latest=Max('pub_date'))['latest']
+        versions = get_versions(('page', 'site'), ('page', scope))
+        validators[scope] = md5(
+            f'{".".join(versions)}:{latest}'.encode()
+        ).hexdigest()
+    return validators[scope]
+
+
+def is_authenticated(request):
+    return (
+        settings.SESSION_COOKIE_NAME in request.COOKIES
+        and request.user.is_authenticated
+    )
+
+
+def user_cache_key(session):
+    backend = session.get(BACKEND_SESSION_KEY)
+    if SESSION_KEY not in session or (
+            backend not in settings.AUTHENTICATION_BACKENDS):
+        return None
+    pk = session[SESSION_KEY]
+    return USER_KEY.format(
+        pk, *get_versions(('user', pk)), session.get(HASH_SESSION_KEY)
+    )
+
+
+def cache_user(session, user):
+    key = user_cache_key(session)
+    if key is not None and user.is_authenticated:
+        cache.set(key, user, USER_CACHE_TIMEOUT)
+
+
+def get_cached_user(request):
+    key = user_cache_key(request.session)
+    if key is None:
+        return get_user(request)
+    user = cache.get(key)
+    if user is None:
+        user = get_user(request)
+        cache_user(request.session, user)
+    return user
+
+
+def get_page_etag(request, scope):
+    validator = get_page_validator(request, scope)
+    if not is_authenticated(request):
+        return validator
+    csrf_cookie = request.COOKIES.get(settings.CSRF_COOKIE_NAME, '')
+    return md5(
+        f'{validator}:{request.user.pk}:{csrf_cookie}'.encode()
+    ).hexdigest()
+
+
+def page_cache_key(request, scope):
+    path = md5(request.get_full_path().encode()).hexdigest()
+    return f'blog:page:{scope}:{path}:{get_page_validator(request, scope)}'
+
+
+def feed_count_key(request, scope, variant=''):
+    return f'blog:count:{scope}:{variant}:{get_page_validator(request, scope)}'
+
+
+def purge_pages(*scopes):
+    bump_versions(*(('page', scope) for scope in scopes))
+
+
+def cache_anonymous_page(scope_template):
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if (request.method not in ('GET', 'HEAD')
+                    or is_authenticated(request)):
+                response = view(request, *args, **kwargs)
+                patch_cache_control(response, private=True)
+                return response
+            timeout = settings.BLOG_PAGE_CACHE_TIMEOUT
+            key = page_cache_key(request, scope_template.format(**kwargs))
+            response = cache.get(key)
+            if response is None:
+                response = view(request, *args, **kwargs)
+                if response.status_code != HTTPStatus.OK or response.cookies:
+                    return response
+                patch_cache_control(response, public=True, max_age=timeout)
+                patch_vary_headers(response, ('Cookie',))
+                cache.set(key, response, timeout)
+            return response
+        return wrapper
+    return decorator
+
+
+def conditional_page(scope_template):
+    def decorator(view):
+        def etag(request, *args, **kwargs):
+            return get_page_etag(request, scope_template.format(**kwargs))
+        return condition(etag_func=etag)(
+            cache_anonymous_page(scope_template)(view)
+        )
+    return decorator
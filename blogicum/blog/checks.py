@@ -0,0 +1,88 @@
+import logging
+
+from django.conf import settings
+from django.core.checks import Error, Warning, register, run_checks
+
+logger = logging.getLogger(__name__)
+
+DEV_ONLY_APPS = ('debug_toolbar',)
+DEV_ONLY_MIDDLEWARE = ('debug_toolbar.middleware.DebugToolbarMiddleware',)
+QUEUED_EMAIL_BACKEND = 'jobs.mail.QueuedEmailBackend'
+PER_PROCESS_CACHES = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+@register('performance')
+def check_dev_components(app_configs, **kwargs):
+    if settings.DEBUG:
+        return []
+    warnings = [
+        Warning(
+            f'Приложение {app} нужно только для разработки.',
+            hint='Уберите его из INSTALLED_APPS производственного профиля.',
+            id='blog.W001',
+        )
+        for app in DEV_ONLY_APPS if app in settings.INSTALLED_APPS
+    ]
+    warnings += [
+        Warning(
+            f'Middleware {middleware} нужен только для разработки.',
+            hint='Уберите его из MIDDLEWARE производственного профиля.',
+            id='blog.W002',
+        )
+        for middleware in DEV_ONLY_MIDDLEWARE
+        if middleware in settings.MIDDLEWARE
+    ]
+    for engine in settings.TEMPLATES:
+        if engine.get('OPTIONS', {}).get('debug'):
+            warnings.append(Warning(
+                'Шаблоны работают в режиме отладки и не кешируются.',
+                hint="Уберите 'debug' из OPTIONS в TEMPLATES.",
+                id='blog.W003',
+            ))
+    for alias, database in settings.DATABASES.items():
+        if not database.get('CONN_MAX_AGE'):
+            warnings.append(Warning(
+                f'База {alias} открывает новое подключение на каждый запрос.',
+                hint='Задайте CONN_MAX_AGE (BLOGICUM_CONN_MAX_AGE).',
+                id='blog.W004',
+            ))
+    if settings.JOBS_EAGER:
+        warnings.append(Warning(
+            'Фоновые задачи выполняются прямо в запросе.',
+            hint='Выключите JOBS_EAGER и запустите run_worker.',
+            id='blog.W005',
+        ))
+    if settings.CACHES['default']['BACKEND'] in PER_PROCESS_CACHES:
+        warnings.append(Warning(
+            'Кеш по умолчанию не разделяется между процессами.',
+            hint='Выберите file или db в BLOGICUM_CACHE_BACKEND.',
+            id='blog.W006',
+        ))
+    if settings.SESSION_ENGINE == 'django.contrib.sessions.backends.db':
+        warnings.append(Warning(
+            'Сессии читаются из базы на каждом запросе.',
+            hint='Выберите cached_db или signed_cookies '
+                 'в BLOGICUM_SESSION_ENGINE.',
+            id='blog.W007',
+        ))
+    return warnings
+
+
+@register()
+def check_email_backends(app_configs, **kwargs):
+    if settings.JOBS_EMAIL_BACKEND != QUEUED_EMAIL_BACKEND:
+        return []
+    return [Error(
+        'JOBS_EMAIL_BACKEND снова ставит письма в очередь, '
+        'и они никогда не отправляются.',
+        hint='Укажите настоящий бэкенд в BLOGICUM_EMAIL_BACKEND.',
+        id='blog.E001',
+    )]
+
+
+def report_startup_checks():
+    for message in run_checks(tags=['performance']):
+        logger.warning('%s', message)
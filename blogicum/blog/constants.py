@@ -2,3 +2,13 @@
 MAX_FIELD_LENGTH = 256
 MAX_SHORT_STRING_LENGTH = 20
 PAGINATE_BY = 10
+COMMENTS_PER_PAGE = 50
+RENDITION_WIDTHS = (320, 640, 960)
+RENDITION_FORMATS = {'jpg': 'JPEG', 'webp': 'WEBP'}
+RENDITION_QUALITY = 80
+ADMIN_COUNT_LIMIT = 10000
+ESTIMATED_COUNT_THRESHOLD = 10000
+FEED_COUNT_TIMEOUT = 300
+PAGE_WINDOW_ON_EACH_SIDE = 2
+PAGE_WINDOW_ON_ENDS = 1
+USER_CACHE_TIMEOUT = 60
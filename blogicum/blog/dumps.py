@@ -0,0 +1,82 @@
+import csv
+import gzip
+import json
+import sys
+from contextlib import nullcontext
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+READ_SIZE = 1024 * 1024
+SEPARATORS = ' \t\r\n,['
+
+
+def open_dump(path, mode='rt'):
+    if str(path).endswith('.gz'):
+        return gzip.open(path, mode, encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+def iter_json_objects(stream, read_size=READ_SIZE):
+    decoder = json.JSONDecoder()
+    buffer = ''
+    position = 0
+    exhausted = False
+    while True:
+        while position < len(buffer) and buffer[position] in SEPARATORS:
+            position += 1
+        if position < len(buffer) and buffer[position] == ']':
+            return
+        try:
+            obj, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if exhausted:
+                if buffer[position:].strip():
+                    raise
+                return
+            chunk = stream.read(read_size)
+            exhausted = not chunk
+            buffer = buffer[position:] + chunk
+            position = 0
+            continue
+        yield obj
+        position = end
+
+
+def open_export(output, compress, stdout=sys.stdout):
+    if output == '-':
+        if compress:
+            return gzip.open(stdout.buffer, 'wt', encoding='utf-8')
+        return nullcontext(stdout)
+    if compress or str(output).endswith('.gz'):
+        return gzip.open(output, 'wt', encoding='utf-8', newline='')
+    return open(output, 'w', encoding='utf-8', newline='')
+
+
+def write_jsonl(stream, fields, rows):
+    written = 0
+    for row in rows:
+        stream.write(json.dumps(
+            dict(zip(fields, row)), cls=DjangoJSONEncoder, ensure_ascii=False
+        ))
+        stream.write('\n')
+        written += 1
+    return written
+
+
+def write_csv(stream, fields, rows):
+    writer = csv.writer(stream)
+    writer.writerow(fields)
+    written = 0
+    for row in rows:
+        writer.writerow(
+            value.isoformat() if hasattr(value, 'isoformat') else value
+            for value in row
+        )
+        written += 1
+    return written
+
+
+WRITERS = {
+    'jsonl': write_jsonl,
+    'csv': write_csv,
+}
@@ -0,0 +1,53 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.signals import request_finished, request_started
+from django.db import connection
+
+from blog.models import Post
+
+
+class Command(BaseCommand):
+    help = (
+        'Сравнивает стоимость запроса с новым и с постоянным '
+        'подключением к базе данных.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=500)
+
+    def handle(self, *args, requests, **options):
+        if connection.vendor == 'sqlite' and connection.is_in_memory_db():
+            raise CommandError('Нужна база данных в файле, а не в памяти.')
+        conn_max_age = connection.settings_dict['CONN_MAX_AGE']
+        results = {}
+        try:
+            for mode, max_age in (('per_request', 0), ('persistent', None)):
+                connection.close()
+                connection.settings_dict['CONN_MAX_AGE'] = max_age
+                results[mode] = self.measure(requests)
+        finally:
+            connection.close()
+            connection.settings_dict['CONN_MAX_AGE'] = conn_max_age
+        results['saving_ms'] = round(
+            results['per_request']['mean_ms']
+            - results['persistent']['mean_ms'], 3
+        )
+        self.stdout.write(json.dumps(results, indent=2))
+
+    def measure(self, requests):
+        connects = 0
+        started = time.perf_counter()
+        for _ in range(requests):
+            request_started.send(sender=self.__class__)
+            if connection.connection is None:
+                connects += 1
+            Post.objects.filter(pk=0).exists()
+            request_finished.send(sender=self.__class__)
+        return {
+            'connects': connects,
+            'mean_ms': round(
+                (time.perf_counter() - started) * 1000 / requests, 3
+            ),
+        }
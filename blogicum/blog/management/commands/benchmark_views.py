@@ -0,0 +1,88 @@
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from blog.benchmark import DEFAULT_BUDGETS, check_budgets, run_benchmarks
+from blog.synthetic import generate_data
+
+
+class Command(BaseCommand):
+    help = (
+        'Измеряет число запросов, задержку и память представлений блога '
+        'на сгенерированных данных.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000)
+        parser.add_argument('--categories', type=int, default=20)
+        parser.add_argument('--locations', type=int, default=50)
+        parser.add_argument('--posts', type=int, default=10000)
+        parser.add_argument('--comments', type=int, default=100000)
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--iterations', type=int, default=20)
+        parser.add_argument(
+            '--cold',
+            action='store_true',
+            help='Очищать кеш перед каждым запросом.'
+        )
+        parser.add_argument(
+            '--view',
+            action='append',
+            dest='views',
+            help='Измерить только указанное представление.'
+        )
+        parser.add_argument(
+            '--budgets',
+            help='JSON-файл с бюджетами вида {"index": {"queries": 6}}.'
+        )
+        parser.add_argument('--output', help='Куда сохранить результаты.')
+        parser.add_argument(
+            '--in-place',
+            action='store_true',
+            help='Использовать текущую базу вместо временной.'
+        )
+
+    def handle(self, *args, **options):
+        budgets = DEFAULT_BUDGETS
+        if options['budgets']:
+            budgets = json.loads(Path(options['budgets']).read_text())
+        if options['in_place']:
+            results = self.benchmark(options)
+        else:
+            old_name = connection.settings_dict['NAME']
+            connection.creation.create_test_db(verbosity=0, autoclobber=True)
+            try:
+                results = self.benchmark(options)
+            finally:
+                connection.creation.destroy_test_db(old_name, verbosity=0)
+        failures = check_budgets(results, budgets)
+        report = json.dumps(
+            {'results': results, 'budgets': budgets, 'failures': failures},
+            ensure_ascii=False,
+            indent=2
+        )
+        if options['output']:
+            Path(options['output']).write_text(report)
+        else:
+            self.stdout.write(report)
+        if failures:
+            raise CommandError(
+                'Превышены бюджеты: ' + '; '.join(failures)
+            )
+
+    def benchmark(self, options):
+        generate_data(
+            users=options['users'],
+            categories=options['categories'],
+            locations=options['locations'],
+            posts=options['posts'],
+            comments=options['comments'],
+            seed=options['seed']
+        )
+        return run_benchmarks(
+            iterations=options['iterations'],
+            cold=options['cold'],
+            views=options['views']
+        )
@@ -0,0 +1,85 @@
+import time
+from argparse import ArgumentTypeError
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from blog.dumps import WRITERS, open_export
+from blog.models import Comment, Post
+
+EXPORTS = {
+    'posts': (Post, (
+        'id', 'title', 'text', 'pub_date', 'created_at', 'is_published',
+        'author_id', 'author__username', 'category_id', 'category__slug',
+        'location_id', 'location__name', 'comment_count',
+    )),
+    'comments': (Comment, (
+        'id', 'post_id', 'author_id', 'author__username', 'text',
+        'created_at',
+    )),
+}
+
+
+def parse_since(value):
+    try:
+        moment = parse_datetime(value)
+        if moment is None:
+            day = parse_date(value)
+            if day is None:
+                raise ValueError(value)
+            moment = datetime.combine(day, datetime.min.time())
+    except ValueError:
+        raise ArgumentTypeError(
+            f'ожидается дата или дата и время в ISO 8601, получено «{value}»'
+        )
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+class Command(BaseCommand):
+    help = 'Потоково выгружает публикации или комментарии в JSONL или CSV.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('table', choices=EXPORTS)
+        parser.add_argument('--format', choices=WRITERS, default='jsonl')
+        parser.add_argument(
+            '--output',
+            default='-',
+            help='Путь к файлу или «-» для стандартного вывода.'
+        )
+        parser.add_argument(
+            '--gzip',
+            action='store_true',
+            help='Сжать выгрузку (включается и для путей с .gz).'
+        )
+        parser.add_argument(
+            '--since',
+            type=parse_since,
+            help='Выгрузить только записи, созданные после этого момента.'
+        )
+        parser.add_argument('--chunk-size', type=int, default=2000)
+
+    def handle(self, *args, table, output, chunk_size, since, **options):
+        model, fields = EXPORTS[table]
+        queryset = model.objects.order_by('pk')
+        if since:
+            queryset = queryset.filter(created_at__gt=since)
+        rows = queryset.values_list(*fields).iterator(chunk_size=chunk_size)
+        started = time.perf_counter()
+        self.stdout.ending = ''
+        try:
+            export = open_export(output, options['gzip'], self.stdout)
+        except AttributeError:
+            raise CommandError(
+                'Поток вывода не принимает сжатые данные, укажите --output.'
+            )
+        with export as stream:
+            written = WRITERS[options['format']](stream, fields, rows)
+        seconds = time.perf_counter() - started
+        self.stderr.write(
+            f'Выгружено строк: {written} за {seconds:.1f} с, '
+            f'{written / max(seconds, 1e-6):.0f} строк/с'
+        )
@@ -0,0 +1,64 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from blog.synthetic import PASSWORD, generate_data
+
+
+class Command(BaseCommand):
+    help = (
+        'Генерирует пользователей, категории, местоположения, публикации '
+        'и комментарии для нагрузочного тестирования.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000)
+        parser.add_argument('--categories', type=int, default=20)
+        parser.add_argument('--locations', type=int, default=50)
+        parser.add_argument('--posts', type=int, default=100000)
+        parser.add_argument('--comments', type=int, default=1000000)
+        parser.add_argument(
+            '--future-ratio',
+            type=float,
+            default=0.05,
+            help='Доля публикаций с датой в будущем.'
+        )
+        parser.add_argument(
+            '--unpublished-ratio',
+            type=float,
+            default=0.05,
+            help='Доля снятых с публикации записей.'
+        )
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        if options['posts'] and not all(
+            options[name] for name in ('users', 'categories', 'locations')
+        ):
+            raise CommandError(
+                'Для публикаций нужны пользователи, категории '
+                'и местоположения.'
+            )
+        if options['comments'] and not options['posts']:
+            raise CommandError('Для комментариев нужны публикации.')
+        self.verbosity = options['verbosity']
+        generate_data(
+            users=options['users'],
+            categories=options['categories'],
+            locations=options['locations'],
+            posts=options['posts'],
+            comments=options['comments'],
+            future_ratio=options['future_ratio'],
+            unpublished_ratio=options['unpublished_ratio'],
+            batch_size=options['batch_size'],
+            seed=options['seed'],
+            report=self.report
+        )
+        self.stdout.write(f'Пароль пользователей: {PASSWORD}')
+
+    def report(self, model, done, total, seconds):
+        if done < total and self.verbosity < 2:
+            return
+        self.stdout.write(
+            f'{model._meta.verbose_name_plural}: {done}/{total}, '
+            f'{seconds:.1f} с, {done / max(seconds, 1e-6):.0f} строк/с'
+        )
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+
+from blog.models import Post
+from blog.renditions import generate_renditions
+
+
+class Command(BaseCommand):
+    help = 'Создаёт уменьшенные копии изображений существующих публикаций.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Пересоздать копии, даже если они уже есть.'
+        )
+        parser.add_argument('--chunk-size', type=int, default=500)
+
+    def handle(self, *args, force, chunk_size, **options):
+        processed = failed = 0
+        posts = Post.objects.exclude(image='').exclude(image__isnull=True)
+        for post in posts.order_by('pk').iterator(chunk_size=chunk_size):
+            if post.image_renditions and not force:
+                continue
+            try:
+                generate_renditions(post)
+            except (OSError, ValueError) as error:
+                failed += 1
+                self.stderr.write(f'Публикация {post.pk}: {error}')
+                continue
+            processed += 1
+        self.stdout.write(
+            f'Обработано публикаций: {processed}, ошибок: {failed}'
+        )
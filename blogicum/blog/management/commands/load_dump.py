@@ -0,0 +1,144 @@
+import json
+import tempfile
+import time
+from collections import Counter
+from contextlib import ExitStack
+from io import StringIO
+from pathlib import Path
+
+from django.apps import apps
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.core.serializers.base import DeserializationError
+from django.core.serializers.python import Deserializer
+from django.db import IntegrityError, connection, transaction
+
+from blog.cache import bump_versions, purge_pages
+from blog.dumps import iter_json_objects, open_dump
+from blog.search import get_search_backend
+
+LOAD_ORDER = (
+    'auth.user',
+    'blog.category',
+    'blog.location',
+    'blog.post',
+    'blog.comment',
+)
+CACHE_SCOPES = {
+    'auth.user': 'user',
+    'blog.category': 'category',
+    'blog.location': 'location',
+    'blog.post': 'post',
+}
+
+
+class Command(BaseCommand):
+    help = (
+        'Потоково загружает дамп в формате dumpdata (JSON или JSON Lines, '
+        'можно .gz) пачками через bulk_create.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--batch-size', type=int, default=2000)
+
+    def handle(self, *args, path, batch_size, **options):
+        self.loaded = Counter()
+        self.skipped = Counter()
+        started = time.perf_counter()
+        with tempfile.TemporaryDirectory() as directory, ExitStack() as stack:
+            spills = {
+                label: stack.enter_context(open(
+                    Path(directory) / f'{label}.jsonl', 'w+',
+                    encoding='utf-8'
+                ))
+                for label in LOAD_ORDER
+            }
+            self.spill(path, spills)
+            for label in LOAD_ORDER:
+                self.load(label, spills[label], batch_size)
+        self.reset_sequences()
+        call_command('recount_comments', stdout=StringIO())
+        get_search_backend().rebuild()
+        purge_pages('site')
+        seconds = time.perf_counter() - started
+        for label in LOAD_ORDER:
+            if self.loaded[label]:
+                self.stdout.write(f'{label}: {self.loaded[label]}')
+        for label, skipped in self.skipped.items():
+            self.stdout.write(f'{label}: пропущено {skipped}')
+        total = sum(self.loaded.values())
+        self.stdout.write(
+            f'Загружено объектов: {total} за {seconds:.1f} с, '
+            f'{total / max(seconds, 1e-6):.0f} строк/с'
+        )
+
+    def spill(self, path, spills):
+        try:
+            with open_dump(path) as stream:
+                for record in iter_json_objects(stream):
+                    label = str(record.get('model', '')).lower()
+                    if label not in spills:
+                        self.skipped[label] += 1
+                        continue
+                    spills[label].write(json.dumps(record))
+                    spills[label].write('\n')
+        except (OSError, ValueError) as error:
+            raise CommandError(f'Не удалось прочитать дамп: {error}')
+
+    def load(self, label, spill, batch_size):
+        spill.seek(0)
+        batch = []
+        for line in spill:
+            batch.append(json.loads(line))
+            if len(batch) >= batch_size:
+                self.flush(label, batch)
+                batch = []
+        if batch:
+            self.flush(label, batch)
+
+    def flush(self, label, records):
+        try:
+            with transaction.atomic():
+                self.save(label, records)
+        except IntegrityError as error:
+            raise CommandError(f'{label}: {error}')
+
+    def save(self, label, records):
+        try:
+            objects = [
+                deserialized.object for deserialized in Deserializer(
+                    records, ignorenonexistent=True
+                )
+            ]
+        except DeserializationError as error:
+            raise CommandError(f'{label}: {error}')
+        model = apps.get_model(label)
+        existing = set(model.objects.filter(
+            pk__in=[obj.pk for obj in objects if obj.pk is not None]
+        ).values_list('pk', flat=True))
+        updated = [obj for obj in objects if obj.pk in existing]
+        if updated:
+            model.objects.bulk_update(updated, [
+                field.name for field in model._meta.concrete_fields
+                if not field.primary_key
+            ])
+            if label in CACHE_SCOPES:
+                bump_versions(
+                    *((CACHE_SCOPES[label], obj.pk) for obj in updated)
+                )
+        model.objects.bulk_create(
+            [obj for obj in objects if obj.pk not in existing]
+        )
+        self.loaded[label] += len(objects)
+
+    def reset_sequences(self):
+        statements = connection.ops.sequence_reset_sql(
+            no_style(),
+            [apps.get_model(label) for label in LOAD_ORDER]
+        )
+        if statements:
+            with connection.cursor() as cursor:
+                for sql in statements:
+                    cursor.execute(sql)
@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F
+
+from blog.models import Post, actual_comment_count
+
+
+class Command(BaseCommand):
+    help = 'Пересчитывает сохранённое число комментариев у публикаций.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Только показать число расхождений.'
+        )
+
+    def handle(self, *args, batch_size, dry_run, **options):
+        checked = repaired = 0
+        last_pk = 0
+        while True:
+            pks = list(
+                Post.objects.filter(pk__gt=last_pk).order_by('pk').values_list(
+                    'pk', flat=True
+                )[:batch_size]
+            )
+            if not pks:
+                break
+            last_pk = pks[-1]
+            checked += len(pks)
+            broken = list(
+                Post.objects.filter(pk__in=pks).annotate(
+                    actual=actual_comment_count()
+                ).exclude(comment_count=F('actual')).values_list(
+                    'pk', flat=True
+                )
+            )
+            if broken and not dry_run:
+                with transaction.atomic():
+                    Post.objects.filter(pk__in=broken).update(
+                        comment_count=actual_comment_count()
+                    )
+            repaired += len(broken)
+        self.stdout.write(
+            f'Проверено публикаций: {checked}, '
+            f'{"найдено" if dry_run else "исправлено"} расхождений: {repaired}'
+        )
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from blog.warmup import warm_templates
+
+
+class Command(BaseCommand):
+    help = 'Загружает и компилирует все шаблоны проекта, показывая время.'
+
+    def handle(self, *args, **options):
+        timings = warm_templates()
+        for name, milliseconds in sorted(
+            timings.items(), key=lambda item: item[1], reverse=True
+        ):
+            self.stdout.write(f'{milliseconds:8.2f} мс  {name}')
+        self.stdout.write(
+            f'Шаблонов: {len(timings)}, всего '
+            f'{sum(timings.values()):.1f} мс'
+        )
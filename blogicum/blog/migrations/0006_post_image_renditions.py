@@ -0,0 +1,18 @@
+# Generated by Django 3.2.16 on 2026-10-17 04:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0005_feed_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='image_renditions',
+            field=models.JSONField(default=list, editable=False, verbose_name='Ширины уменьшенных копий изображения'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+from django.db import migrations
+
+CREATE_TABLE = '''
+CREATE VIRTUAL TABLE IF NOT EXISTS blog_post_fts USING fts5(
+    title, text, author, category, location,
+    tokenize = 'unicode61 remove_diacritics 2'
+)
+'''
+FILL_TABLE = '''
+INSERT INTO blog_post_fts (rowid, title, text, author, category, location)
+SELECT blog_post.id, {}, {}, {}, {}, {}
+FROM blog_post
+INNER JOIN auth_user ON auth_user.id = blog_post.author_id
+LEFT JOIN blog_category ON blog_category.id = blog_post.category_id
+LEFT JOIN blog_location ON blog_location.id = blog_post.location_id
+'''.format(*(
+    f"REPLACE(REPLACE({column}, 'ё', 'е'), 'Ё', 'Е')" for column in (
+        'blog_post.title',
+        'blog_post.text',
+        'auth_user.username',
+        'blog_category.title',
+        'blog_location.name',
+    )
+))
+
+
+def create_search_table(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute(CREATE_TABLE)
+    schema_editor.execute(FILL_TABLE)
+
+
+def drop_search_table(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute('DROP TABLE IF EXISTS blog_post_fts')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0006_post_image_renditions'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_table, drop_search_table),
+    ]
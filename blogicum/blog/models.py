@@ -1,5 +1,7 @@
 from django.contrib.auth import get_user_model
 from django.db import models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 
 from .constants import MAX_FIELD_LENGTH, MAX_SHORT_STRING_LENGTH
 
@@ -94,11 +96,37 @@ class Post(PublishedModel):
         null=True,
         blank=True
     )
+    image_renditions = models.JSONField(
+        default=list,
+        editable=False,
+        verbose_name='Ширины уменьшенных копий изображения'
+    )
+    comment_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Количество комментариев'
+    )
 
     class Meta:
         verbose_name = 'публикация'
         verbose_name_plural = 'Публикации'
         ordering = ('-pub_date',)
+        indexes = (
+            models.Index(
+                fields=('pub_date',),
+                condition=models.Q(is_published=True),
+                name='post_published_idx'
+            ),
+            models.Index(
+                fields=('category', 'pub_date'),
+                condition=models.Q(is_published=True),
+                name='post_category_idx'
+            ),
+            models.Index(
+                fields=('author', 'pub_date'),
+                name='post_author_idx'
+            ),
+        )
 
     def __str__(self):
         return self.title[:MAX_SHORT_STRING_LENGTH]
@@ -127,6 +155,20 @@ class Comment(models.Model):
         verbose_name = 'комментарий'
         verbose_name_plural = 'Комментарии'
         ordering = ['created_at']
+        indexes = (
+            models.Index(
+                fields=('post', 'created_at'),
+                name='comment_post_idx'
+            ),
+        )
 
     def __str__(self):
         return self.text[:MAX_SHORT_STRING_LENGTH]
+
+
+def actual_comment_count():
+    return Coalesce(Subquery(
+        Comment.objects.filter(post=OuterRef('pk')).order_by().values(
+            'post'
+        ).annotate(count=Count('pk')).values('count')
+    ), 0)
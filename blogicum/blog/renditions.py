@@ -0,0 +1,62 @@
+import os
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps
+
+from .cache import bump_versions
+from .constants import RENDITION_FORMATS, RENDITION_QUALITY, RENDITION_WIDTHS
+from .models import Post
+
+
+def rendition_name(name, width, extension):
+    stem, _ = os.path.splitext(name)
+    return f'{stem}_{width}w.{extension}'
+
+
+def rendition_url(image, width, extension):
+    return image.storage.url(rendition_name(image.name, width, extension))
+
+
+def save_rendition(storage, name, image, image_format):
+    buffer = BytesIO()
+    image.save(
+        buffer, format=image_format, quality=RENDITION_QUALITY, optimize=True
+    )
+    if storage.exists(name):
+        storage.delete(name)
+    storage.save(name, ContentFile(buffer.getvalue()))
+
+
+def generate_renditions(post):
+    widths = []
+    if post.image:
+        with post.image.open('rb') as image_file:
+            original = ImageOps.exif_transpose(Image.open(image_file))
+            original = original.convert('RGB')
+        widths = [width for width in RENDITION_WIDTHS
+                  if width < original.width]
+        for width in widths:
+            resized = original.resize(
+                (width, round(original.height * width / original.width)),
+                Image.Resampling.LANCZOS
+            )
+            for extension, image_format in RENDITION_FORMATS.items():
+                save_rendition(
+                    post.image.storage,
+                    rendition_name(post.image.name, width, extension),
+                    resized,
+                    image_format
+                )
+    if widths != post.image_renditions:
+        Post.objects.filter(pk=post.pk).update(image_renditions=widths)
+        post.image_renditions = widths
+        bump_versions(('post', post.pk))
+    return widths
+
+
+def delete_renditions(name, widths):
+    storage = Post._meta.get_field('image').storage
+    for width in widths:
+        for extension in RENDITION_FORMATS:
+            storage.delete(rendition_name(name, width, extension))
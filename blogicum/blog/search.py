@@ -0,0 +1,112 @@
+import re
+from functools import reduce
+from operator import or_
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import F, Q, TextField, Value
+from django.db.models.functions import Replace
+from django.utils.module_loading import import_string
+
+from .models import Post
+
+SEARCH_TABLE = 'blog_post_fts'
+SEARCH_FIELDS = (
+    'title',
+    'text',
+    'author__username',
+    'category__title',
+    'location__name',
+)
+SEARCH_WEIGHTS = (10.0, 1.0, 5.0, 2.0, 2.0)
+MAX_SEARCH_TERMS = 10
+
+
+def get_search_terms(query):
+    return re.findall(r'\w+', query.lower())[:MAX_SEARCH_TERMS]
+
+
+def fold_yo(expression):
+    return Replace(
+        Replace(expression, Value('ё'), Value('е'), output_field=TextField()),
+        Value('Ё'),
+        Value('Е'),
+        output_field=TextField()
+    )
+
+
+class SimpleSearchBackend:
+    def search(self, queryset, query):
+        terms = get_search_terms(query)
+        if not terms:
+            return queryset.none()
+        for term in terms:
+            queryset = queryset.filter(reduce(or_, (
+                Q(**{f'{field}__icontains': term}) for field in SEARCH_FIELDS
+            )))
+        return queryset
+
+    def index_posts(self, posts):
+        pass
+
+    def remove_posts(self, pks):
+        pass
+
+    def rebuild(self):
+        return Post.objects.count()
+
+
+class FTS5SearchBackend(SimpleSearchBackend):
+    def search(self, queryset, query):
+        terms = get_search_terms(query.replace('ё', 'е').replace('Ё', 'Е'))
+        if not terms:
+            return queryset.none()
+        weights = ', '.join(str(weight) for weight in SEARCH_WEIGHTS)
+        return queryset.extra(
+            tables=[SEARCH_TABLE],
+            where=[
+                f'{SEARCH_TABLE}.rowid = blog_post.id',
+                f'{SEARCH_TABLE} MATCH %s',
+            ],
+            params=[' '.join(f'"{term}"*' for term in terms)],
+            select={'rank': f'bm25({SEARCH_TABLE}, {weights})'},
+        ).order_by('rank', '-pub_date')
+
+    def index_posts(self, posts):
+        sql, params = posts.order_by().values_list(
+            'pk', *(fold_yo(F(field)) for field in SEARCH_FIELDS)
+        ).query.sql_with_params()
+        self.remove_posts(posts.values('pk'))
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'INSERT INTO {SEARCH_TABLE} '
+                f'(rowid, title, text, author, category, location) {sql}',
+                params
+            )
+
+    def remove_posts(self, pks):
+        if hasattr(pks, 'query'):
+            sql, params = pks.order_by().query.sql_with_params()
+        else:
+            pks = list(pks)
+            sql = ', '.join(['%s'] * len(pks)) or 'NULL'
+            params = pks
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'DELETE FROM {SEARCH_TABLE} WHERE rowid IN ({sql})', params
+            )
+
+    def rebuild(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {SEARCH_TABLE}')
+        self.index_posts(Post.objects.all())
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES (%s)',
+                ['optimize']
+            )
+        return Post.objects.count()
+
+
+def get_search_backend():
+    return import_string(settings.BLOG_SEARCH_BACKEND)()
@@ -0,0 +1,216 @@
+from contextlib import contextmanager
+from threading import local
+
+from django.contrib.auth.signals import user_logged_in
+from django.db.models import F
+from django.db.models.signals import (post_delete, post_init, post_save,
+                                      pre_delete)
+from django.dispatch import receiver
+
+from jobs.queue import enqueue
+
+from .cache import bump_versions, cache_user, purge_pages
+from .models import (Category, Comment, Location, Post, User,
+                     actual_comment_count)
+from .search import get_search_backend
+
+
+class DeleteState(local):
+    def __init__(self):
+        self.posts = set()
+        self.authors = set()
+        self.recount = set()
+
+
+deleting = DeleteState()
+
+
+def change_comment_count(post_id, delta):
+    posts = Post.objects.filter(pk=post_id)
+    if delta < 0:
+        posts = posts.filter(comment_count__gte=-delta)
+    posts.update(comment_count=F('comment_count') + delta)
+    bump_versions(('post', post_id))
+    purge_comment_post(post_id)
+
+
+def purge_comment_post(post_id):
+    post = Post.objects.filter(pk=post_id).values(
+        'category__slug', 'author__username'
+    ).first()
+    if post:
+        purge_post_pages(
+            post_id, post['category__slug'], post['author__username']
+        )
+
+
+def purge_post_pages(post_id, category_slug, username):
+    purge_pages(
+        'index',
+        f'post:{post_id}',
+        f'category:{category_slug}',
+        f'profile:{username}',
+    )
+
+
+@receiver(post_init, sender=Comment)
+def remember_comment_post(sender, instance, **kwargs):
+    instance._initial_post_id = instance.__dict__.get('post_id')
+
+
+@receiver(post_save, sender=Comment)
+def count_saved_comment(sender, instance, created, **kwargs):
+    if created:
+        change_comment_count(instance.post_id, 1)
+    elif instance._initial_post_id not in (None, instance.post_id):
+        change_comment_count(instance._initial_post_id, -1)
+        change_comment_count(instance.post_id, 1)
+    else:
+        purge_comment_post(instance.post_id)
+    instance._initial_post_id = instance.post_id
+
+
+def recount_comment_posts(post_ids):
+    if post_ids:
+        Post.objects.filter(pk__in=post_ids).update(
+            comment_count=actual_comment_count()
+        )
+        purge_pages('site')
+
+
+@contextmanager
+def deferred_comment_counts(post_ids):
+    post_ids = set(post_ids) - deleting.posts
+    deleting.posts |= post_ids
+    try:
+        yield
+    finally:
+        deleting.posts -= post_ids
+    recount_comment_posts(post_ids)
+
+
+@receiver(post_delete, sender=Comment)
+def count_deleted_comment(sender, instance, **kwargs):
+    if (instance.post_id in deleting.posts
+            or instance.author_id in deleting.authors):
+        return
+    change_comment_count(instance.post_id, -1)
+
+
+@receiver(pre_delete, sender=Post)
+def skip_deleted_post_comments(sender, instance, **kwargs):
+    deleting.posts.add(instance.pk)
+
+
+@receiver(post_delete, sender=Post)
+def forget_deleted_post(sender, instance, **kwargs):
+    deleting.posts.discard(instance.pk)
+
+
+@receiver(pre_delete, sender=User)
+def skip_deleted_author_comments(sender, instance, **kwargs):
+    deleting.authors.add(instance.pk)
+    deleting.recount.update(
+        Comment.objects.filter(author=instance).exclude(
+            post__author=instance
+        ).order_by().values_list('post_id', flat=True).distinct()
+    )
+
+
+@receiver(post_init, sender=Post)
+def remember_post_relations(sender, instance, **kwargs):
+    instance._initial_relations = (
+        instance.__dict__.get('author_id'),
+        instance.__dict__.get('category_id'),
+    )
+    instance._initial_image = str(instance.__dict__.get('image') or '')
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def invalidate_post(sender, instance, created=False, **kwargs):
+    bump_versions(('post', instance.pk))
+    relations = (instance.author_id, instance.category_id)
+    if not created and instance._initial_relations != relations:
+        purge_pages('site')
+    instance._initial_relations = relations
+    purge_post_pages(
+        instance.pk,
+        instance.category.slug if instance.category_id else None,
+        instance.author.username,
+    )
+
+
+@receiver(post_save, sender=Post)
+def index_post(sender, instance, **kwargs):
+    get_search_backend().index_posts(Post.objects.filter(pk=instance.pk))
+
+
+@receiver(post_delete, sender=Post)
+def unindex_post(sender, instance, **kwargs):
+    get_search_backend().remove_posts([instance.pk])
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_category(sender, instance, **kwargs):
+    bump_versions(('category', instance.pk))
+    purge_pages('site')
+    get_search_backend().index_posts(Post.objects.filter(category=instance))
+
+
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+def invalidate_location(sender, instance, **kwargs):
+    bump_versions(('location', instance.pk))
+    purge_pages('site')
+    get_search_backend().index_posts(Post.objects.filter(location=instance))
+
+
+@receiver(post_init, sender=User)
+def remember_username(sender, instance, **kwargs):
+    instance._initial_username = instance.__dict__.get('username')
+
+
+@receiver(post_save, sender=User)
+def invalidate_user(sender, instance, created, update_fields=None,
+                    **kwargs):
+    if update_fields and set(update_fields) <= {'last_login'}:
+        return
+    bump_versions(('user', instance.pk))
+    if not created:
+        purge_pages('site')
+        if getattr(instance, '_initial_username', None) != instance.username:
+            enqueue('blog.tasks.index_author_posts', author_id=instance.pk)
+    instance._initial_username = instance.username
+
+
+@receiver(post_delete, sender=User)
+def forget_user(sender, instance, **kwargs):
+    bump_versions(('user', instance.pk))
+    deleting.authors.discard(instance.pk)
+    post_ids, deleting.recount = deleting.recount, set()
+    recount_comment_posts(post_ids)
+
+
+@receiver(user_logged_in)
+def remember_logged_in_user(sender, request, user, **kwargs):
+    cache_user(request.session, user)
+
+
+@receiver(post_save, sender=Post)
+def process_post_image(sender, instance, **kwargs):
+    image = instance.image.name or ''
+    if image == instance._initial_image:
+        return
+    if instance.image_renditions:
+        enqueue(
+            'blog.tasks.remove_renditions',
+            name=instance._initial_image,
+            widths=instance.image_renditions
+        )
+        Post.objects.filter(pk=instance.pk).update(image_renditions=[])
+        instance.image_renditions = []
+    instance._initial_image = image
+    if image:
+        enqueue('blog.tasks.process_post_image', post_id=instance.pk)
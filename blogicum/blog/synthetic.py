@@ -0,0 +1,100 @@
+import random
+import time
+from datetime import timedelta
+from io import StringIO
+from itertools import islice
+
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.db import transaction
+from django.db.models import Max, Min
+from django.utils import timezone
+
+from .cache import purge_pages
+from .models import Category, Comment, Location, Post, User
+from .search import get_search_backend
+
+PASSWORD = 'generated'
+PUB_DATE_SPREAD = timedelta(days=365)
+FUTURE_SPREAD = timedelta(days=30)
+
+
+def next_pk(model):
+    return (model.objects.aggregate(last=Max('pk'))['last'] or 0) + 1
+
+
+def insert(model, objects, total, batch_size, report):
+    last_pk = next_pk(model) - 1
+    started = time.perf_counter()
+    done = 0
+    with transaction.atomic():
+        while done < total:
+            batch = list(islice(objects, batch_size))
+            if not batch:
+                break
+            model.objects.bulk_create(batch)
+            done += len(batch)
+            if report:
+                report(model, done, total, time.perf_counter() - started)
+    inserted = model.objects.filter(pk__gt=last_pk).aggregate(
+        first=Min('pk'), last=Max('pk')
+    )
+    return range(inserted['first'] or 1, (inserted['last'] or 0) + 1)
+
+
+def generate_data(users, categories, locations, posts, comments,
+                  future_ratio=0.05, unpublished_ratio=0.05,
+                  batch_size=1000, seed=0, report=None):
+    rng = random.Random(seed)
+    now = timezone.now()
+    password = make_password(PASSWORD)
+    offset = next_pk(User)
+    user_pks = insert(User, (
+        User(username=f'user{offset + number}', password=password)
+        for number in range(users)
+    ), users, batch_size, report)
+    offset = next_pk(Category)
+    category_pks = insert(Category, (
+        Category(
+            title=f'Категория {offset + number}',
+            description='Описание категории',
+            slug=f'category-{offset + number}',
+            is_published=rng.random() >= unpublished_ratio
+        ) for number in range(categories)
+    ), categories, batch_size, report)
+    location_pks = insert(Location, (
+        Location(
+            name=f'Место {number}',
+            is_published=rng.random() >= unpublished_ratio
+        ) for number in range(locations)
+    ), locations, batch_size, report)
+
+    def pub_date():
+        if rng.random() < future_ratio:
+            return now + rng.random() * FUTURE_SPREAD
+        return now - rng.random() * PUB_DATE_SPREAD
+
+    post_pks = insert(Post, (
+        Post(
+            title=f'Публикация {number}',
+            text='Текст публикации. ' * rng.randint(5, 50),
+            pub_date=pub_date(),
+            author_id=rng.choice(user_pks),
+            category_id=rng.choice(category_pks),
+            location_id=rng.choice(location_pks),
+            is_published=rng.random() >= unpublished_ratio
+        ) for number in range(posts)
+    ), posts, batch_size, report)
+    insert(Comment, (
+        Comment(
+            text=f'Комментарий {number}',
+            post_id=rng.choice(post_pks),
+            author_id=rng.choice(user_pks)
+        ) for number in range(comments)
+    ), comments, batch_size, report)
+    if comments:
+        call_command('recount_comments', stdout=StringIO())
+    get_search_backend().index_posts(Post.objects.filter(
+        pk__gte=post_pks.start, pk__lt=post_pks.stop
+    ))
+    purge_pages('site')
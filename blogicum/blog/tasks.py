@@ -0,0 +1,17 @@
+from .models import Post
+from .renditions import delete_renditions, generate_renditions
+from .search import get_search_backend
+
+
+def process_post_image(post_id):
+    post = Post.objects.filter(pk=post_id).first()
+    if post is not None:
+        generate_renditions(post)
+
+
+def remove_renditions(name, widths):
+    delete_renditions(name, widths)
+
+
+def index_author_posts(author_id):
+    get_search_backend().index_posts(Post.objects.filter(author_id=author_id))
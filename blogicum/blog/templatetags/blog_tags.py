@@ -0,0 +1,28 @@
+from django import template
+
+from blog.cache import get_card_version
+from blog.constants import PAGE_WINDOW_ON_EACH_SIDE, PAGE_WINDOW_ON_ENDS
+from blog.renditions import rendition_url
+
+register = template.Library()
+
+
+@register.filter
+def card_version(post):
+    return get_card_version(post)
+
+
+@register.filter
+def srcset(post, extension):
+    return ', '.join(
+        f'{rendition_url(post.image, width, extension)} {width}w'
+        for width in post.image_renditions
+    )
+
+
+@register.simple_tag
+def page_window(page_obj, on_each_side=PAGE_WINDOW_ON_EACH_SIDE,
+                on_ends=PAGE_WINDOW_ON_ENDS):
+    return list(page_obj.paginator.get_elided_page_range(
+        page_obj.number, on_each_side=on_each_side, on_ends=on_ends
+    ))
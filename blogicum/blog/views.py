@@ -1,50 +1,62 @@
+from django.conf import settings
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.forms import UserChangeForm
 from django.contrib.auth.models import User
 from django.core.paginator import Paginator
-from django.db.models import Count
+from django.db import transaction
+from django.db.models import Q
 from django.shortcuts import get_object_or_404, redirect, render
 from django.utils import timezone
+from django.utils.http import urlencode
 
-from .constants import PAGINATE_BY
+from .cache import conditional_page, feed_count_key
+from .constants import COMMENTS_PER_PAGE, PAGINATE_BY
 from .forms import CommentForm, DeletePostForm, PostForm
 from .models import Category, Comment, Post
-
-
-def get_page(request, queryset, paginate_by=PAGINATE_BY):
-    return Paginator(
-        queryset,
-        paginate_by
-    ).get_page(request.GET.get('page', 1))
+from .paginators import CachedCountPaginator, KeysetPaginator
+from .search import get_search_backend
+
+
+def get_page(request, queryset, paginate_by=PAGINATE_BY, keyset=None,
+             count_key=None):
+    cursor = request.GET.get('cursor')
+    if keyset is None:
+        keyset = settings.BLOG_KEYSET_PAGINATION or cursor is not None
+    if keyset:
+        return KeysetPaginator(queryset, paginate_by).get_page(cursor)
+    if count_key:
+        paginator = CachedCountPaginator(queryset, paginate_by, count_key)
+    else:
+        paginator = Paginator(queryset, paginate_by)
+    return paginator.get_page(request.GET.get('page', 1))
+
+
+def published_filter():
+    return Q(
+        is_published=True,
+        category__is_published=True,
+        pub_date__lte=timezone.now()
+    )
 
 
 def process_posts(
         posts=Post.objects.all(),
         apply_filter=True,
         use_select_related=True,
-        annotate=True,
 ):
     if use_select_related:
         posts = posts.select_related('author', 'location', 'category')
     if apply_filter:
-        posts = posts.filter(
-            is_published=True,
-            category__is_published=True,
-            pub_date__lte=timezone.now()
-        )
-    if annotate:
-        posts = posts.annotate(
-            comment_count=Count('comments')
-        ).order_by(
-            *Post._meta.ordering
-        )
+        posts = posts.filter(published_filter())
     return posts
 
 
+@conditional_page('index')
 def index(request):
     page_obj = get_page(
         request,
-        process_posts(Post.objects.all())
+        process_posts(Post.objects.all()),
+        count_key=feed_count_key(request, 'index')
     )
     return render(
         request,
@@ -53,24 +65,40 @@ def index(request):
     )
 
 
+def search(request):
+    query = request.GET.get('q', '').strip()
+    page_obj = get_page(
+        request,
+        get_search_backend().search(process_posts(), query),
+        keyset=False
+    )
+    return render(request, 'blog/search.html', {
+        'page_obj': page_obj,
+        'query': query,
+        'paginator_query': urlencode({'q': query}) + '&',
+    })
+
+
+@conditional_page('post:{post_id}')
 def post_detail(request, post_id):
-    post = get_object_or_404(Post, id=post_id)
-    if post.author != request.user:
-        post = get_object_or_404(
-            process_posts(
-                apply_filter=True,
-                use_select_related=False,
-                annotate=False
-            ),
-            id=post_id
-        )
+    visible = published_filter()
+    if request.user.is_authenticated:
+        visible |= Q(author=request.user)
+    post = get_object_or_404(
+        process_posts(apply_filter=False).filter(visible),
+        id=post_id
+    )
     return render(request, 'blog/detail.html', {
         'post': post,
         'form': CommentForm(),
-        'comments': post.comments.all(),
+        'comments': Paginator(
+            post.comments.select_related('author'),
+            COMMENTS_PER_PAGE
+        ).get_page(request.GET.get('comments_page', 1)),
     })
 
 
+@conditional_page('category:{category_slug}')
 def category_posts(request, category_slug):
     category = get_object_or_404(
         Category,
@@ -81,7 +109,8 @@ def category_posts(request, category_slug):
         'category': category,
         'page_obj': get_page(
             request,
-            process_posts(category.posts.all())
+            process_posts(category.posts.all()),
+            count_key=feed_count_key(request, f'category:{category_slug}')
         )
     })
 
@@ -113,6 +142,7 @@ def edit_post(request, post_id):
     return redirect('blog:post_detail', post_id=post.id)
 
 
+@conditional_page('profile:{username}')
 def profile(request, username):
     author = get_object_or_404(User, username=username)
     is_author = (author == request.user)
@@ -122,7 +152,13 @@ def profile(request, username):
     )
     return render(request, 'blog/profile.html', {
         'profile': author,
-        'page_obj': get_page(request, posts)
+        'page_obj': get_page(
+            request,
+            posts,
+            count_key=feed_count_key(
+                request, f'profile:{username}', 'own' if is_author else ''
+            )
+        )
     })
 
 
@@ -137,7 +173,8 @@ def add_comment(request, post_id):
     comment = form.save(commit=False)
     comment.author = request.user
     comment.post = post
-    comment.save()
+    with transaction.atomic():
+        comment.save()
     return redirect('blog:post_detail', post_id=post_id)
 
 
@@ -186,7 +223,8 @@ def delete_comment(request, post_id, comment_id):
     if comment.author != request.user:
         return redirect('blog:post_detail', post_id=post_id)
     if request.method == 'POST':
-        comment.delete()
+        with transaction.atomic():
+            comment.delete()
         return redirect('blog:post_detail', post_id=post_id)
     return render(request, 'blog/comment.html',
                   {'comment': comment, 'post': post})
@@ -0,0 +1,39 @@
+import logging
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.template import engines
+
+logger = logging.getLogger(__name__)
+
+
+def project_template_names(engine):
+    seen = set()
+    for loader in engine.template_loaders:
+        for directory in loader.get_dirs():
+            directory = Path(directory)
+            if settings.BASE_DIR not in directory.parents:
+                continue
+            for path in sorted(directory.rglob('*.html')):
+                name = path.relative_to(directory).as_posix()
+                if name not in seen:
+                    seen.add(name)
+                    yield name
+
+
+def warm_templates():
+    timings = {}
+    for backend in engines.all():
+        engine = getattr(backend, 'engine', None)
+        if engine is None:
+            continue
+        for name in project_template_names(engine):
+            started = time.perf_counter()
+            engine.get_template(name)
+            timings[name] = (time.perf_counter() - started) * 1000
+    logger.info(
+        'Шаблонов загружено: %d за %.1f мс',
+        len(timings), sum(timings.values())
+    )
+    return timings
@@ -0,0 +1,52 @@
+import os
+
+from .base import *  # noqa: F401,F403
+from .base import (BASE_DIR, CACHE_BACKENDS, DATABASES, EMAIL_BACKEND,
+                   TEMPLATES)
+
+DEBUG = False
+
+ALLOWED_HOSTS = os.getenv('BLOGICUM_ALLOWED_HOSTS', 'localhost').split(',')
+
+DATABASES = {
+    'default': {
+        **DATABASES['default'],
+        'CONN_MAX_AGE': int(os.getenv('BLOGICUM_CONN_MAX_AGE', 600)),
+    },
+}
+
+TEMPLATES = [{
+    **TEMPLATES[0],
+    'APP_DIRS': False,
+    'OPTIONS': {
+        'context_processors': [
+            processor
+            for processor in TEMPLATES[0]['OPTIONS']['context_processors']
+            if processor != 'django.template.context_processors.debug'
+        ],
+        'loaders': [
+            ('django.template.loaders.cached.Loader', [
+                'django.template.loaders.filesystem.Loader',
+                'django.template.loaders.app_directories.Loader',
+            ]),
+        ],
+    },
+}]
+
+BLOG_WARM_TEMPLATES = True
+
+STATIC_ROOT = BASE_DIR / 'static'
+STATICFILES_STORAGE = (
+    'django.contrib.staticfiles.storage.ManifestStaticFilesStorage'
+)
+
+CACHES = {
+    'default': {
+        **CACHE_BACKENDS[os.getenv('BLOGICUM_CACHE_BACKEND', 'file')],
+        'OPTIONS': {'MAX_ENTRIES': 100000},
+    },
+}
+
+JOBS_EMAIL_BACKEND = os.getenv('BLOGICUM_EMAIL_BACKEND', EMAIL_BACKEND)
+EMAIL_BACKEND = 'jobs.mail.QueuedEmailBackend'
+JOBS_EAGER = False
@@ -14,3 +14,12 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'blogicum.settings')
 
 application = get_wsgi_application()
+
+from django.conf import settings  # noqa: E402
+
+from blog.checks import report_startup_checks  # noqa: E402
+from blog.warmup import warm_templates  # noqa: E402
+
+report_startup_checks()
+if settings.BLOG_WARM_TEMPLATES:
+    warm_templates()
@@ -0,0 +1,16 @@
+from django.contrib import admin
+
+from .models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ('task',
+                    'status',
+                    'attempts',
+                    'run_after',
+                    'created_at',
+                    'finished_at')
+    search_fields = ('task',)
+    list_filter = ('status', 'task')
+    readonly_fields = ('created_at', 'started_at', 'finished_at')
@@ -0,0 +1,7 @@
+MAX_TASK_LENGTH = 256
+MAX_ATTEMPTS = 3
+VISIBILITY_TIMEOUT = 300
+RETRY_DELAY = 30
+KEEP_FINISHED_HOURS = 24
+POLL_INTERVAL = 1
+CLAIM_CANDIDATES = 10
@@ -0,0 +1,72 @@
+from base64 import b64decode, b64encode
+from email.mime.base import MIMEBase
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.mail import get_connection
+from django.core.mail.backends.base import BaseEmailBackend
+from django.core.mail.message import EmailMultiAlternatives
+
+from .queue import enqueue
+
+
+def dump_attachment(attachment):
+    filename, content, mimetype = attachment
+    if isinstance(content, bytes):
+        return [filename, b64encode(content).decode(), mimetype, True]
+    return [filename, content, mimetype, False]
+
+
+def load_attachment(filename, content, mimetype, encoded):
+    return filename, b64decode(content) if encoded else content, mimetype
+
+
+class QueuedEmailBackend(BaseEmailBackend):
+    def send_messages(self, email_messages):
+        direct = []
+        for message in email_messages:
+            if any(
+                isinstance(attachment, MIMEBase)
+                for attachment in message.attachments
+            ):
+                direct.append(message)
+                continue
+            enqueue(
+                'jobs.mail.send_queued_email',
+                subject=message.subject,
+                body=message.body,
+                from_email=message.from_email,
+                to=message.to,
+                cc=message.cc,
+                bcc=message.bcc,
+                reply_to=message.reply_to,
+                headers=message.extra_headers,
+                alternatives=list(
+                    getattr(message, 'alternatives', [])
+                ),
+                attachments=[
+                    dump_attachment(attachment)
+                    for attachment in message.attachments
+                ],
+            )
+        if direct:
+            get_connection(
+                settings.JOBS_EMAIL_BACKEND, fail_silently=self.fail_silently
+            ).send_messages(direct)
+        return len(email_messages)
+
+
+def send_queued_email(alternatives=(), attachments=(), **fields):
+    if settings.JOBS_EMAIL_BACKEND == f'{__name__}.QueuedEmailBackend':
+        raise ImproperlyConfigured(
+            'JOBS_EMAIL_BACKEND не может быть QueuedEmailBackend.'
+        )
+    message = EmailMultiAlternatives(
+        connection=get_connection(settings.JOBS_EMAIL_BACKEND),
+        alternatives=[tuple(alternative) for alternative in alternatives],
+        attachments=[
+            load_attachment(*attachment) for attachment in attachments
+        ],
+        **fields
+    )
+    message.send()
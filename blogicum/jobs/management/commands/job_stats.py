@@ -0,0 +1,12 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from jobs.queue import queue_stats
+
+
+class Command(BaseCommand):
+    help = 'Показывает глубину очереди и задержку выполнения задач.'
+
+    def handle(self, *args, **options):
+        self.stdout.write(json.dumps(queue_stats(), indent=2))
@@ -0,0 +1,43 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from jobs.constants import (
+    KEEP_FINISHED_HOURS, POLL_INTERVAL, RETRY_DELAY, VISIBILITY_TIMEOUT
+)
+from jobs.queue import claim_job, prune_finished, run_job
+
+
+class Command(BaseCommand):
+    help = 'Выполняет задачи из очереди фоновых задач.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Выполнить доступные задачи и завершиться.'
+        )
+        parser.add_argument(
+            '--visibility-timeout', type=int, default=VISIBILITY_TIMEOUT
+        )
+        parser.add_argument('--retry-delay', type=int, default=RETRY_DELAY)
+        parser.add_argument('--sleep', type=float, default=POLL_INTERVAL)
+        parser.add_argument(
+            '--keep-finished-hours', type=int, default=KEEP_FINISHED_HOURS
+        )
+
+    def handle(self, *args, once, visibility_timeout, retry_delay, sleep,
+               keep_finished_hours, **options):
+        processed = 0
+        while True:
+            job = claim_job(visibility_timeout)
+            if job is None:
+                prune_finished(timedelta(hours=keep_finished_hours))
+                if once:
+                    break
+                time.sleep(sleep)
+                continue
+            run_job(job, retry_delay)
+            processed += 1
+        self.stdout.write(f'Выполнено задач: {processed}')
@@ -0,0 +1,125 @@
+import logging
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Avg, Count, F, Min, Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .constants import CLAIM_CANDIDATES, RETRY_DELAY, VISIBILITY_TIMEOUT
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue(task, run_after=None, **kwargs):
+    if settings.JOBS_EAGER:
+        import_string(task)(**kwargs)
+        return None
+    return Job.objects.create(
+        task=task,
+        kwargs=kwargs,
+        run_after=run_after or timezone.now()
+    )
+
+
+def available_jobs(now):
+    return Job.objects.filter(
+        Q(status=Job.Status.QUEUED, run_after__lte=now)
+        | Q(status=Job.Status.RUNNING, locked_until__lt=now)
+    )
+
+
+def claim_job(visibility_timeout=VISIBILITY_TIMEOUT):
+    now = timezone.now()
+    candidates = available_jobs(now).order_by('run_after').values_list(
+        'pk', flat=True
+    )[:CLAIM_CANDIDATES]
+    for pk in candidates:
+        claimed = available_jobs(now).filter(pk=pk).update(
+            status=Job.Status.RUNNING,
+            locked_until=now + timedelta(seconds=visibility_timeout),
+            attempts=F('attempts') + 1,
+            started_at=now
+        )
+        if claimed:
+            return Job.objects.get(pk=pk)
+    return None
+
+
+def finish_job(job, **fields):
+    return Job.objects.filter(
+        pk=job.pk, locked_until=job.locked_until
+    ).update(locked_until=None, **fields)
+
+
+def run_job(job, retry_delay=RETRY_DELAY):
+    if job.attempts > job.max_attempts:
+        return finish_job(
+            job,
+            status=Job.Status.FAILED,
+            finished_at=timezone.now(),
+            last_error='Превышено время выполнения задачи.'
+        )
+    try:
+        import_string(job.task)(**job.kwargs)
+    except Exception:
+        error = traceback.format_exc()
+        logger.exception('Задача %s завершилась с ошибкой', job)
+        if job.attempts >= job.max_attempts:
+            return finish_job(
+                job,
+                status=Job.Status.FAILED,
+                finished_at=timezone.now(),
+                last_error=error
+            )
+        return finish_job(
+            job,
+            status=Job.Status.QUEUED,
+            run_after=timezone.now() + timedelta(
+                seconds=retry_delay * 2 ** (job.attempts - 1)
+            ),
+            last_error=error
+        )
+    return finish_job(
+        job, status=Job.Status.DONE, finished_at=timezone.now()
+    )
+
+
+def prune_finished(older_than):
+    return Job.objects.filter(
+        status=Job.Status.DONE,
+        finished_at__lt=timezone.now() - older_than
+    ).delete()[0]
+
+
+def queue_stats():
+    now = timezone.now()
+    depth = dict(
+        Job.objects.order_by().values_list('status').annotate(Count('pk'))
+    )
+    oldest = Job.objects.filter(status=Job.Status.QUEUED).aggregate(
+        oldest=Min('created_at')
+    )['oldest']
+    latency = Job.objects.filter(
+        status=Job.Status.DONE,
+        finished_at__gte=now - timedelta(hours=1)
+    ).aggregate(
+        wait=Avg(F('started_at') - F('created_at')),
+        total=Avg(F('finished_at') - F('created_at')),
+    )
+    return {
+        'depth': {
+            status.value: depth.get(status.value, 0) for status in Job.Status
+        },
+        'oldest_queued_seconds': (
+            (now - oldest).total_seconds() if oldest else 0
+        ),
+        'avg_wait_seconds': (
+            latency['wait'].total_seconds() if latency['wait'] else 0
+        ),
+        'avg_latency_seconds': (
+            latency['total'].total_seconds() if latency['total'] else 0
+        ),
+    }
@@ -0,0 +1,60 @@
+import logging
+from functools import lru_cache
+
+from django.core.cache import cache
+from django.urls import get_resolver
+
+logger = logging.getLogger(__name__)
+
+NOT_FOUND_COUNT_KEY = 'pages:404:count:{}'
+NOT_FOUND_LOGGED_KEY = 'pages:404:logged:{}'
+NOT_FOUND_LOG_INTERVAL = 60
+OTHER_PREFIX = '*'
+
+
+def collect_prefixes(patterns, route=''):
+    prefixes = set()
+    for pattern in patterns:
+        full = route + str(pattern.pattern).lstrip('^')
+        if '/' not in full and hasattr(pattern, 'url_patterns'):
+            prefixes |= collect_prefixes(pattern.url_patterns, full)
+            continue
+        head = full.split('/')[0]
+        if not any(char in head for char in '<(['):
+            prefixes.add(head)
+    return prefixes
+
+
+@lru_cache(maxsize=None)
+def url_prefixes():
+    return frozenset(collect_prefixes(get_resolver().url_patterns))
+
+
+def path_prefix(path):
+    head = path.lstrip('/').split('/')[0]
+    return head if head in url_prefixes() else OTHER_PREFIX
+
+
+def record_not_found(path):
+    prefix = path_prefix(path)
+    key = NOT_FOUND_COUNT_KEY.format(prefix)
+    cache.add(key, 0, None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, None)
+    if cache.add(
+        NOT_FOUND_LOGGED_KEY.format(prefix), True, NOT_FOUND_LOG_INTERVAL
+    ):
+        logger.warning('Страница не найдена: %s', path)
+
+
+def not_found_counts():
+    prefixes = sorted(url_prefixes() | {OTHER_PREFIX})
+    counts = cache.get_many(
+        [NOT_FOUND_COUNT_KEY.format(prefix) for prefix in prefixes]
+    )
+    return {
+        prefix: counts.get(NOT_FOUND_COUNT_KEY.format(prefix), 0)
+        for prefix in prefixes
+    }
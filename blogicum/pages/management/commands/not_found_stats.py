@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from pages.errors import not_found_counts
+
+
+class Command(BaseCommand):
+    help = 'Показывает число ответов 404 по префиксам адресов.'
+
+    def handle(self, *args, **options):
+        counts = not_found_counts()
+        for prefix, count in sorted(
+            counts.items(), key=lambda item: item[1], reverse=True
+        ):
+            self.stdout.write(f'{count:8d}  /{prefix}')
+        self.stdout.write(f'Всего 404: {sum(counts.values())}')
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from pages.prerender import prerender_pages
+
+
+class Command(BaseCommand):
+    help = (
+        'Рендерит статические страницы и страницы ошибок в HTML-файлы '
+        'с хешем в имени и записывает манифест.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output')
+
+    def handle(self, *args, output, **options):
+        manifest = prerender_pages(output)
+        for name, filename in manifest.items():
+            self.stdout.write(f'{name}: {filename}')
+        self.stdout.write(f'Страниц отрендерено: {len(manifest)}')
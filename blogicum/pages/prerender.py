@@ -0,0 +1,120 @@
+import json
+from functools import lru_cache
+from hashlib import md5
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpRequest, HttpResponse
+from django.template.loader import render_to_string
+from django.urls import resolve, reverse
+from django.utils.cache import (get_conditional_response,
+                                patch_cache_control, patch_vary_headers)
+from django.utils.html import escape
+
+MANIFEST_NAME = 'manifest.json'
+URL_MARKER = '__prerendered_url__'
+PAGES = {
+    'about': ('pages/about.html', 'pages:about'),
+    'rules': ('pages/rules.html', 'pages:rules'),
+    '403csrf': ('pages/403csrf.html', None),
+    '404': ('pages/404.html', None),
+    '500': ('pages/500.html', None),
+}
+
+
+def anonymous_request(url_name=None):
+    request = HttpRequest()
+    request.method = 'GET'
+    request.user = AnonymousUser()
+    request.build_absolute_uri = lambda location=None: URL_MARKER
+    if url_name:
+        request.path = request.path_info = reverse(url_name)
+        request.resolver_match = resolve(request.path)
+    return request
+
+
+def render_page(name):
+    template_name, url_name = PAGES[name]
+    return render_to_string(
+        template_name, request=anonymous_request(url_name)
+    ).encode()
+
+
+def prerender_pages(root=None):
+    root = Path(root or settings.PAGES_PRERENDER_ROOT)
+    root.mkdir(parents=True, exist_ok=True)
+    manifest = {}
+    for name in PAGES:
+        body = render_page(name)
+        filename = f'{name}.{md5(body).hexdigest()[:12]}.html'
+        (root / filename).write_bytes(body)
+        manifest[name] = filename
+    (root / MANIFEST_NAME).write_text(
+        json.dumps(manifest, indent=2), encoding='utf-8'
+    )
+    for path in root.glob('*.html'):
+        if path.name not in manifest.values():
+            path.unlink()
+    load_prerendered.cache_clear()
+    return manifest
+
+
+@lru_cache(maxsize=None)
+def load_prerendered():
+    root = Path(settings.PAGES_PRERENDER_ROOT)
+    try:
+        manifest = json.loads(
+            (root / MANIFEST_NAME).read_text(encoding='utf-8')
+        )
+        return {
+            name: ((root / filename).read_bytes(), filename.split('.')[1])
+            for name, filename in manifest.items()
+        }
+    except (OSError, ValueError):
+        return {}
+
+
+def get_prerendered(name):
+    return load_prerendered().get(name)
+
+
+def has_session(request):
+    return settings.SESSION_COOKIE_NAME in request.COOKIES
+
+
+def prerendered_response(request, page):
+    body, digest = page
+    etag = f'"{digest}"'
+    response = get_conditional_response(request, etag=etag)
+    if response is not None:
+        return response
+    response = HttpResponse(body)
+    response['ETag'] = etag
+    patch_cache_control(
+        response, public=True, max_age=settings.PAGES_PRERENDER_MAX_AGE
+    )
+    patch_vary_headers(response, ('Cookie',))
+    return response
+
+
+def error_response(request, template_name, status):
+    name = Path(template_name).stem
+    page = get_prerendered(name)
+    body = page[0] if page else render_page(name)
+    marker = URL_MARKER.encode()
+    if marker in body:
+        body = body.replace(
+            marker, escape(request.build_absolute_uri()).encode()
+        )
+    return HttpResponse(body, status=status)
+
+
+class PrerenderedMixin:
+    prerendered_name = None
+
+    def get(self, request, *args, **kwargs):
+        page = get_prerendered(self.prerendered_name)
+        if page is None or has_session(request):
+            return super().get(request, *args, **kwargs)
+        return prerendered_response(request, page)
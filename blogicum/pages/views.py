@@ -1,24 +1,27 @@
-from django.shortcuts import render
-
-
 from django.views.generic import TemplateView
 
+from .errors import record_not_found
+from .prerender import PrerenderedMixin, error_response
+
 
-class AboutView(TemplateView):
+class AboutView(PrerenderedMixin, TemplateView):
     template_name = 'pages/about.html'
+    prerendered_name = 'about'
 
 
-class RulesView(TemplateView):
+class RulesView(PrerenderedMixin, TemplateView):
     template_name = 'pages/rules.html'
+    prerendered_name = 'rules'
 
 
 def csrf_failure(request, reason=""):
-    return render(request, 'pages/403csrf.html', status=403)
+    return error_response(request, 'pages/403csrf.html', status=403)
 
 
 def custom_404(request, exception):
-    return render(request, 'pages/404.html', status=404)
+    record_not_found(request.path)
+    return error_response(request, 'pages/404.html', status=404)
 
 
 def custom_500(request):
-    return render(request, 'pages/500.html', status=500)
+    return error_response(request, 'pages/500.html', status=500)
@@ -0,0 +1,64 @@
+import pytest
+from django.db import connection
+
+from blog.models import Post
+from blog.paginators import EstimatedCountPaginator
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def many_posts(mixer, user, another_user, published_category):
+    mixer.cycle(15).blend(
+        "blog.Post", author=user, category=published_category
+    )
+    mixer.cycle(5).blend(
+        "blog.Post", author=another_user, category=published_category
+    )
+
+
+def test_post_changelist_queries_do_not_grow(
+        admin_client, many_posts, django_assert_max_num_queries
+):
+    with django_assert_max_num_queries(12):
+        response = admin_client.get("/admin/blog/post/")
+    assert response.status_code == 200
+    assert len(response.context["cl"].result_list) == 20
+
+
+def test_author_filter_is_an_input(admin_client, many_posts, another_user):
+    content = admin_client.get("/admin/blog/post/").content.decode()
+    assert f"author__id__exact={another_user.pk}" not in content, (
+        "Убедитесь, что фильтр по автору не выводит список всех пользователей."
+    )
+    response = admin_client.get(
+        "/admin/blog/post/", {"author": another_user.username}
+    )
+    assert len(response.context["cl"].result_list) == 5
+
+
+def test_comment_changelist_filters_by_post(admin_client, mixer):
+    comments = mixer.cycle(3).blend("blog.Comment")
+    response = admin_client.get(
+        "/admin/blog/comment/", {"post": comments[0].post_id}
+    )
+    assert list(response.context["cl"].result_list) == [comments[0]]
+    response = admin_client.get("/admin/blog/comment/", {"post": "abc"})
+    assert list(response.context["cl"].result_list) == []
+
+
+def test_paginator_uses_statistics(many_posts):
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+        cursor.execute(
+            "UPDATE sqlite_stat1 SET stat = '50000 1' WHERE tbl = 'blog_post'"
+        )
+        cursor.execute("ANALYZE sqlite_schema")
+    paginator = EstimatedCountPaginator(Post.objects.order_by("pk"), 100)
+    assert paginator.count == 50000, (
+        "Убедитесь, что для больших таблиц используется оценка числа строк."
+    )
+    filtered = EstimatedCountPaginator(
+        Post.objects.filter(is_published=True).order_by("pk"), 100
+    )
+    assert filtered.count == Post.objects.filter(is_published=True).count()
@@ -0,0 +1,64 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client
+
+pytestmark = [pytest.mark.django_db]
+
+
+def user_queries(client, url="/pages/rules/"):
+    statements = []
+
+    def record(execute, sql, params, many, context):
+        statements.append(sql)
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(record):
+        response = client.get(url)
+    return response, sum('"auth_user"' in sql for sql in statements)
+
+
+def test_user_loaded_from_cache(user, user_client):
+    response, first = user_queries(user_client)
+    assert first == 0, (
+        "Убедитесь, что пользователь кэшируется при входе."
+    )
+    cache.clear()
+    response, cold = user_queries(user_client)
+    assert cold == 1
+    response, second = user_queries(user_client)
+    assert second == 0, (
+        "Убедитесь, что пользователь берётся из кэша и не читается из базы"
+        " на каждом запросе."
+    )
+    assert user.username in response.content.decode()
+
+
+def test_user_cache_invalidated_on_save(user, user_client):
+    user_queries(user_client)
+    user.username = "renamed"
+    user.save()
+    response, queries = user_queries(user_client)
+    assert queries == 1
+    assert "renamed" in response.content.decode(), (
+        "Убедитесь, что кэш пользователя сбрасывается при изменении профиля."
+    )
+
+
+def test_password_change_logs_out_other_sessions(user):
+    user.set_password("old-password-1")
+    user.save()
+    first, second = Client(), Client()
+    first.force_login(user)
+    second.force_login(user)
+    user_queries(second)
+    response = first.post("/auth/password_change/", {
+        "old_password": "old-password-1",
+        "new_password1": "new-password-2",
+        "new_password2": "new-password-2",
+    })
+    assert response.status_code == 302
+    assert user.username in first.get("/pages/rules/").content.decode()
+    assert user.username not in second.get("/pages/rules/").content.decode(), (
+        "Убедитесь, что после смены пароля остальные сессии завершаются."
+    )
@@ -0,0 +1,55 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+pytestmark = [pytest.mark.django_db]
+
+SMALL_DATASET = (
+    "--in-place", "--users", "5", "--categories", "2", "--locations", "2",
+    "--posts", "40", "--comments", "80", "--iterations", "2",
+)
+
+
+def test_benchmark_reports_every_view():
+    out = StringIO()
+    call_command("benchmark_views", *SMALL_DATASET, stdout=out)
+    report = json.loads(out.getvalue())
+    assert not report["failures"]
+    for view, result in report["results"].items():
+        assert result["p95_ms"] >= result["p50_ms"]
+        if view.startswith("render_"):
+            continue
+        assert result["status"] < 400, (
+            f"Убедитесь, что сценарий `{view}` выполняется без ошибок."
+        )
+        assert result["queries"] > 0
+    assert {"render_index_uncached", "render_index_cached"} <= set(
+        report["results"]
+    )
+
+
+def test_benchmark_fails_over_budget(tmp_path):
+    budgets = tmp_path / "budgets.json"
+    budgets.write_text(json.dumps({"index": {"queries": 1}}))
+    with pytest.raises(CommandError, match="index: queries"):
+        call_command(
+            "benchmark_views", *SMALL_DATASET, "--view", "index",
+            "--budgets", str(budgets), stdout=StringIO()
+        )
+
+
+def test_session_engines_benchmarked():
+    out = StringIO()
+    call_command("benchmark_views", *SMALL_DATASET, stdout=out)
+    results = json.loads(out.getvalue())["results"]
+    assert results["session_db_authenticated"]["session_queries"] > 0
+    for engine in ("cached_db", "cache", "signed_cookies"):
+        assert results[f"session_{engine}_authenticated"][
+            "session_queries"
+        ] == 0, (
+            f"Убедитесь, что сессии `{engine}` не читаются из базы"
+            " на каждом запросе."
+        )
+        assert results[f"session_{engine}_anonymous"]["session_queries"] == 0
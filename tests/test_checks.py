@@ -0,0 +1,60 @@
+import importlib
+
+import pytest
+from django.test import override_settings
+
+from blog.checks import check_dev_components, check_email_backends
+
+
+def warning_ids():
+    return {message.id for message in check_dev_components(None)}
+
+
+def test_dev_components_reported_without_debug():
+    ids = warning_ids()
+    assert {"blog.W001", "blog.W002", "blog.W005"} <= ids, (
+        "Убедитесь, что проверка сообщает об инструментах разработки,"
+        " оставшихся включёнными без DEBUG."
+    )
+
+
+@override_settings(DEBUG=True)
+def test_dev_components_allowed_in_debug():
+    assert warning_ids() == set()
+
+
+@pytest.fixture
+def prod_settings():
+    return importlib.import_module("blogicum.settings.prod")
+
+
+def test_prod_profile_is_clean(prod_settings):
+    assert "debug_toolbar" not in prod_settings.INSTALLED_APPS
+    assert prod_settings.DATABASES["default"]["CONN_MAX_AGE"] > 0
+    with override_settings(**{
+        name: getattr(prod_settings, name)
+        for name in (
+            "DEBUG",
+            "INSTALLED_APPS",
+            "MIDDLEWARE",
+            "JOBS_EAGER",
+            "CACHES",
+            "SESSION_ENGINE",
+        )
+    }):
+        assert warning_ids() <= {"blog.W004"}, (
+            "Убедитесь, что производственный профиль не включает"
+            " дорогие компоненты для разработки."
+        )
+
+
+def test_prod_profile_delivers_queued_email(prod_settings):
+    assert prod_settings.EMAIL_BACKEND == "jobs.mail.QueuedEmailBackend"
+    assert prod_settings.JOBS_EMAIL_BACKEND != prod_settings.EMAIL_BACKEND, (
+        "Убедитесь, что воркер отправляет письма настоящим бэкендом,"
+        " а не ставит их в очередь снова."
+    )
+    with override_settings(JOBS_EMAIL_BACKEND=prod_settings.EMAIL_BACKEND):
+        assert [
+            message.id for message in check_email_backends(None)
+        ] == ["blog.E001"]
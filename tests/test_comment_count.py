@@ -0,0 +1,104 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from blog.models import Comment, Post
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_comment_count_follows_views(
+        user_client, post_with_published_location
+):
+    post = post_with_published_location
+    user_client.post(
+        f"/posts/{post.id}/add_comment/", data={"text": "Комментарий"}
+    )
+    post.refresh_from_db()
+    assert post.comment_count == 1, (
+        "Убедитесь, что при добавлении комментария увеличивается"
+        " сохранённое число комментариев публикации."
+    )
+
+    comment = post.comments.get()
+    user_client.post(f"/posts/{post.id}/delete_comment/{comment.id}/")
+    post.refresh_from_db()
+    assert post.comment_count == 0, (
+        "Убедитесь, что при удалении комментария уменьшается"
+        " сохранённое число комментариев публикации."
+    )
+
+
+def test_comment_count_follows_moves_and_cascades(
+        mixer, user, post_with_published_location, post_of_another_author
+):
+    comments = mixer.cycle(3).blend(
+        Comment, post=post_with_published_location
+    )
+    comments[0].post = post_of_another_author
+    comments[0].save()
+    post_with_published_location.refresh_from_db()
+    post_of_another_author.refresh_from_db()
+    assert post_with_published_location.comment_count == 2
+    assert post_of_another_author.comment_count == 1
+
+    comments[1].author.delete()
+    post_with_published_location.refresh_from_db()
+    assert post_with_published_location.comment_count == 1
+
+
+def test_recount_comments_repairs_counts(
+        mixer, post_with_published_location
+):
+    mixer.cycle(2).blend(Comment, post=post_with_published_location)
+    Post.objects.update(comment_count=7)
+    out = StringIO()
+    call_command("recount_comments", "--batch-size=1", stdout=out)
+    post_with_published_location.refresh_from_db()
+    assert post_with_published_location.comment_count == 2
+    assert "исправлено расхождений: 1" in out.getvalue()
+
+
+def count_queries(action):
+    with CaptureQueriesContext(connection) as queries:
+        action()
+    return len(queries)
+
+
+def test_cascade_deletes_do_not_update_per_comment(
+        mixer, user, another_user, post_with_published_location,
+        post_of_another_author
+):
+    mixer.cycle(50).blend(Comment, post=post_with_published_location)
+    assert count_queries(post_with_published_location.delete) < 10, (
+        "Убедитесь, что при удалении публикации её комментарии не"
+        " пересчитываются по одному."
+    )
+    mixer.cycle(30).blend(
+        Comment, post=post_of_another_author, author=user
+    )
+    mixer.blend(Comment, post=post_of_another_author, author=another_user)
+    assert count_queries(user.delete) < 20
+    post_of_another_author.refresh_from_db()
+    assert post_of_another_author.comment_count == 1, (
+        "Убедитесь, что после удаления автора комментариев число"
+        " комментариев пересчитывается."
+    )
+
+
+def test_admin_bulk_delete_recounts(
+        admin_client, mixer, post_with_published_location
+):
+    comments = mixer.cycle(5).blend(
+        Comment, post=post_with_published_location
+    )
+    admin_client.post("/admin/blog/comment/", {
+        "action": "delete_selected",
+        "post": "yes",
+        "_selected_action": [comment.pk for comment in comments[:4]],
+    })
+    post_with_published_location.refresh_from_db()
+    assert post_with_published_location.comment_count == 1
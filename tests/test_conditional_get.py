@@ -0,0 +1,102 @@
+from datetime import timedelta
+from http import HTTPStatus
+
+import pytest
+from django.utils import timezone
+
+from blog.models import Comment, Post
+
+pytestmark = [pytest.mark.django_db]
+
+
+def get_urls(post):
+    return (
+        "/",
+        f"/posts/{post.id}/",
+        f"/category/{post.category.slug}/",
+        f"/profile/{post.author.username}/",
+    )
+
+
+@pytest.mark.parametrize("client_name", ["client", "user_client"])
+def test_not_modified(request, client_name, post_with_published_location):
+    view_client = request.getfixturevalue(client_name)
+    for url in get_urls(post_with_published_location):
+        # The first visit may issue a CSRF cookie that is part of the ETag.
+        view_client.get(url)
+        etag = view_client.get(url)["ETag"]
+        response = view_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.NOT_MODIFIED, (
+            f"Убедитесь, что страница `{url}` отвечает статусом 304, если"
+            " у клиента актуальная версия."
+        )
+        assert not response.content
+
+
+def test_etag_changes_with_content(
+        client, user_client, another_user_client, post_with_published_location
+):
+    post = post_with_published_location
+    url = f"/posts/{post.id}/"
+    anonymous_etag = client.get(url)["ETag"]
+    user_client.get(url)
+    user_etag = user_client.get(url)["ETag"]
+    assert anonymous_etag != user_etag
+    assert another_user_client.get(
+        url, HTTP_IF_NONE_MATCH=user_etag
+    ).status_code == HTTPStatus.OK, (
+        "Убедитесь, что ETag страницы зависит от пользователя."
+    )
+
+    user_client.post(f"{url}add_comment/", data={"text": "Комментарий"})
+    for view_client, etag in (
+        (client, anonymous_etag), (user_client, user_etag)
+    ):
+        assert view_client.get(
+            url, HTTP_IF_NONE_MATCH=etag
+        ).status_code == HTTPStatus.OK, (
+            "Убедитесь, что ETag страницы меняется после добавления"
+            " комментария."
+        )
+
+
+def test_etag_follows_scheduled_posts(
+        client, mixer, post_with_published_location
+):
+    scheduled = mixer.blend(
+        "blog.Post",
+        category=post_with_published_location.category,
+        pub_date=timezone.now() + timedelta(days=1),
+    )
+    etag = client.get("/")["ETag"]
+    Post.objects.filter(pk=scheduled.pk).update(
+        pub_date=timezone.now() - timedelta(minutes=1)
+    )
+    response = client.get("/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.OK
+    assert scheduled.title in response.content.decode(), (
+        "Убедитесь, что отложенная публикация появляется в ленте, как только"
+        " наступает время публикации."
+    )
+
+
+def test_etag_changes_after_comment_edit(
+        user, user_client, post_with_published_location
+):
+    post = post_with_published_location
+    comment = Comment.objects.create(post=post, author=user, text="Старый")
+    url = f"/posts/{post.id}/"
+    user_client.get(url)
+    etag = user_client.get(url)["ETag"]
+    assert user_client.get(
+        url, HTTP_IF_NONE_MATCH=etag
+    ).status_code == HTTPStatus.NOT_MODIFIED
+    user_client.post(
+        f"{url}edit_comment/{comment.id}/", data={"text": "Исправленный"}
+    )
+    response = user_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.OK, (
+        "Убедитесь, что ETag страницы меняется после редактирования"
+        " комментария."
+    )
+    assert "Исправленный" in response.content.decode()
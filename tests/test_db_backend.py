@@ -0,0 +1,39 @@
+import pytest
+from django.db import connection
+
+from blogicum.backends.sqlite3.base import DatabaseWrapper
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_pragmas_applied_on_connect():
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA synchronous")
+        assert cursor.fetchone()[0] == 1, (
+            "Убедитесь, что при подключении к SQLite выставляется"
+            " `synchronous = NORMAL`."
+        )
+
+
+def test_broken_connection_is_replaced(tmp_path):
+    wrapper = DatabaseWrapper(
+        {
+            **connection.settings_dict,
+            "NAME": str(tmp_path / "health.sqlite3"),
+            "CONN_MAX_AGE": None,
+        },
+        alias="health",
+    )
+    wrapper.ensure_connection()
+    with wrapper.cursor() as cursor:
+        cursor.execute("PRAGMA journal_mode")
+        assert cursor.fetchone()[0] == "wal"
+    wrapper.connection.close()
+    wrapper.close_if_unusable_or_obsolete()
+    with wrapper.cursor() as cursor:
+        cursor.execute("SELECT 1")
+        assert cursor.fetchone()[0] == 1, (
+            "Убедитесь, что сломанное постоянное подключение"
+            " заменяется новым перед следующим запросом."
+        )
+    wrapper.close()
@@ -0,0 +1,87 @@
+import csv
+import gzip
+import json
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.utils import timezone
+
+from blog.models import Comment
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_export_posts_csv(tmp_path, post_with_published_location):
+    path = tmp_path / "posts.csv"
+    err = StringIO()
+    call_command(
+        "export_data", "posts", "--format", "csv", "--output", str(path),
+        stderr=err
+    )
+    with open(path, encoding="utf-8", newline="") as stream:
+        rows = list(csv.DictReader(stream))
+    assert [int(row["id"]) for row in rows] == [
+        post_with_published_location.pk
+    ]
+    assert rows[0]["author__username"] == (
+        post_with_published_location.author.username
+    )
+    assert "Выгружено строк: 1" in err.getvalue()
+
+
+def test_export_comments_jsonl_gzip(tmp_path, mixer):
+    comment = mixer.blend("blog.Comment")
+    path = tmp_path / "comments.jsonl.gz"
+    call_command(
+        "export_data", "comments", "--output", str(path), "--chunk-size", "1",
+        stderr=StringIO()
+    )
+    with gzip.open(path, "rt", encoding="utf-8") as stream:
+        records = [json.loads(line) for line in stream]
+    assert records == [{
+        "id": comment.pk,
+        "post_id": comment.post_id,
+        "author_id": comment.author_id,
+        "author__username": comment.author.username,
+        "text": comment.text,
+        "created_at": records[0]["created_at"],
+    }], "Убедитесь, что выгрузка комментариев сжимается и содержит все поля."
+
+
+def test_export_since_accepts_dates(tmp_path, mixer):
+    old, new = mixer.cycle(2).blend("blog.Comment")
+    Comment.objects.filter(pk=old.pk).update(
+        created_at=timezone.now() - timedelta(days=3)
+    )
+    path = tmp_path / "comments.jsonl"
+    since = (timezone.localdate() - timedelta(days=1)).isoformat()
+    call_command(
+        "export_data", "comments", "--output", str(path), "--since", since,
+        stderr=StringIO()
+    )
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [record["id"] for record in records] == [new.pk], (
+        "Убедитесь, что --since принимает дату без времени."
+    )
+    for value in ("вчера", "2026-13-01"):
+        with pytest.raises(CommandError, match="--since"):
+            call_command(
+                "export_data", "comments", "--since", value,
+                stdout=StringIO(), stderr=StringIO()
+            )
+
+
+def test_export_to_command_stdout(post_with_published_location):
+    out = StringIO()
+    call_command("export_data", "posts", stdout=out, stderr=StringIO())
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [record["id"] for record in records] == [
+        post_with_published_location.pk
+    ], "Убедитесь, что выгрузка пишется в stdout команды."
+    with pytest.raises(CommandError, match="--output"):
+        call_command(
+            "export_data", "posts", "--gzip", stdout=StringIO(),
+            stderr=StringIO()
+        )
@@ -0,0 +1,60 @@
+import pytest
+
+from blog.models import Post
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_post_card_is_cached(user_client, post_with_published_location):
+    post = post_with_published_location
+    user_client.get("/")
+    Post.objects.filter(pk=post.pk).update(title="Без сигналов")
+    assert post.title in user_client.get("/").content.decode(), (
+        "Убедитесь, что карточка публикации берётся из кэша фрагментов."
+    )
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda post: setattr(post, "title", "Новый заголовок") or post.save(),
+        lambda post: setattr(
+            post.category, "title", "Новая категория"
+        ) or post.category.save(),
+        lambda post: setattr(
+            post.location, "name", "Новое место"
+        ) or post.location.save(),
+        lambda post: setattr(
+            post.author, "username", "new_author"
+        ) or post.author.save(),
+    ],
+    ids=["post", "category", "location", "author"],
+)
+def test_post_card_cache_invalidation(
+        client, post_with_published_location, change
+):
+    post = post_with_published_location
+    client.get("/")
+    change(post)
+    content = client.get("/").content.decode()
+    for expected in (
+        post.title, post.category.title, post.location.name,
+        post.author.username
+    ):
+        assert expected in content, (
+            "Убедитесь, что кэш карточки публикации сбрасывается при"
+            " изменении публикации, её категории, места или автора."
+        )
+
+
+def test_post_card_cache_follows_comments(
+        user_client, post_with_published_location
+):
+    post = post_with_published_location
+    user_client.get("/")
+    user_client.post(
+        f"/posts/{post.id}/add_comment/", data={"text": "Комментарий"}
+    )
+    assert "Комментарии (1)" in user_client.get("/").content.decode(), (
+        "Убедитесь, что кэш карточки сбрасывается при добавлении комментария."
+    )
@@ -0,0 +1,54 @@
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.utils import timezone
+
+from blog.models import Category, Comment, Location, Post, User
+
+pytestmark = [pytest.mark.django_db]
+
+
+def generate(*args):
+    out = StringIO()
+    call_command(
+        "generate_data", "--users", "10", "--categories", "3",
+        "--locations", "4", "--posts", "200", "--comments", "500",
+        "--batch-size", "64", *args, stdout=out
+    )
+    return out.getvalue()
+
+
+def test_generate_data_creates_rows():
+    output = generate("--future-ratio", "0.2", "--unpublished-ratio", "0.2")
+    assert User.objects.count() == 10
+    assert Category.objects.count() == 3
+    assert Location.objects.count() == 4
+    assert Post.objects.count() == 200
+    assert Comment.objects.count() == 500
+    assert Post.objects.filter(pub_date__gt=timezone.now()).exists(), (
+        "Убедитесь, что часть публикаций получает дату в будущем."
+    )
+    assert Post.objects.filter(is_published=False).exists()
+    assert sum(Post.objects.values_list("comment_count", flat=True)) == 500, (
+        "Убедитесь, что после генерации пересчитывается число комментариев."
+    )
+    assert "строк/с" in output
+
+
+def test_generate_data_is_deterministic():
+    generate("--seed", "7")
+    first = list(Post.objects.values_list("title", "is_published", "text"))
+    Post.objects.all().delete()
+    generate("--seed", "7")
+    second = list(Post.objects.values_list("title", "is_published", "text"))
+    assert first == second
+    assert User.objects.count() == 20, (
+        "Убедитесь, что повторная генерация не конфликтует с уже созданными"
+        " пользователями."
+    )
+
+
+def test_generate_data_needs_relations():
+    with pytest.raises(CommandError):
+        call_command("generate_data", "--users", "0", stdout=StringIO())
@@ -0,0 +1,65 @@
+import re
+from typing import List, Tuple
+
+import pytest
+from django.db import connection
+
+pytestmark = [pytest.mark.django_db]
+
+FEED_TABLES = ("blog_post", "blog_comment")
+
+
+def capture_feed_queries(client, url: str) -> List[Tuple[str, tuple]]:
+    captured = []
+
+    def wrapper(execute, sql, params, many, context):
+        if sql.startswith("SELECT") and any(
+            f'FROM "{table}"' in sql for table in FEED_TABLES
+        ):
+            captured.append((sql, params))
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(wrapper):
+        client.get(url)
+    return captured
+
+
+def get_plan_problems(sql: str, params) -> List[str]:
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        plan = [row[-1] for row in cursor.fetchall()]
+    return [
+        line for line in plan
+        if re.match(rf"SCAN ({'|'.join(FEED_TABLES)})\b", line)
+        and "INDEX" not in line
+        or "TEMP B-TREE" in line
+    ]
+
+
+@pytest.mark.parametrize(
+    "view_name, get_url",
+    [
+        ("index", lambda post: "/"),
+        ("index", lambda post: "/?cursor="),
+        ("category_posts", lambda post: f"/category/{post.category.slug}/"),
+        ("profile", lambda post: f"/profile/{post.author.username}/"),
+        ("post_detail", lambda post: f"/posts/{post.id}/"),
+    ],
+)
+def test_feed_queries_use_indexes(
+        client, user_client, post_with_published_location, comment_to_a_post,
+        view_name, get_url
+):
+    url = get_url(post_with_published_location)
+    for view_client in (client, user_client):
+        queries = capture_feed_queries(view_client, url)
+        assert queries, (
+            f"Убедитесь, что страница `{view_name}` загружает публикации."
+        )
+        for sql, params in queries:
+            problems = get_plan_problems(sql, params)
+            assert not problems, (
+                f"Убедитесь, что запросы страницы `{view_name}` используют"
+                " индексы, а не полный перебор или сортировку таблицы:"
+                f" {problems}\n{sql}"
+            )
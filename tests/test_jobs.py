@@ -0,0 +1,146 @@
+from datetime import timedelta
+from email.mime.text import MIMEText
+from io import BytesIO, StringIO
+
+import pytest
+from PIL import Image
+from django.core import mail
+from django.core.files.images import ImageFile
+from django.core.mail import EmailMessage, send_mail
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+
+from blog.models import Post
+from jobs.models import Job
+from jobs.queue import claim_job, enqueue, queue_stats, run_job
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture(autouse=True)
+def queued_jobs(tmp_path):
+    with override_settings(JOBS_EAGER=False, MEDIA_ROOT=str(tmp_path)):
+        yield
+
+
+def test_job_succeeds():
+    job = enqueue("json.loads", s="{}")
+    claimed = claim_job()
+    assert claimed == job
+    assert claim_job() is None
+    run_job(claimed)
+    job.refresh_from_db()
+    assert job.status == Job.Status.DONE
+    assert job.attempts == 1
+    stats = queue_stats()
+    assert stats["depth"]["done"] == 1
+    assert stats["avg_latency_seconds"] >= 0
+
+
+def test_job_retries_then_fails():
+    job = enqueue("json.loads", s="{")
+    for attempt in range(1, job.max_attempts + 1):
+        Job.objects.filter(pk=job.pk).update(run_after=timezone.now())
+        claimed = claim_job()
+        assert claimed.attempts == attempt
+        run_job(claimed, retry_delay=60)
+    job.refresh_from_db()
+    assert job.status == Job.Status.FAILED
+    assert "JSONDecodeError" in job.last_error
+    assert queue_stats()["depth"]["failed"] == 1
+
+
+def test_retry_is_delayed():
+    job = enqueue("json.loads", s="{")
+    run_job(claim_job(), retry_delay=60)
+    job.refresh_from_db()
+    assert job.status == Job.Status.QUEUED
+    assert job.run_after > timezone.now() + timedelta(seconds=30)
+    assert claim_job() is None
+
+
+def test_expired_lock_is_reclaimed():
+    job = enqueue("json.loads", s="{}")
+    stale = claim_job(visibility_timeout=60)
+    assert claim_job() is None
+    Job.objects.filter(pk=job.pk).update(
+        locked_until=timezone.now() - timedelta(seconds=1)
+    )
+    fresh = claim_job()
+    assert fresh.attempts == 2
+    run_job(stale)
+    assert Job.objects.get(pk=job.pk).status == Job.Status.RUNNING, (
+        "Убедитесь, что воркер с истёкшей блокировкой не меняет задачу."
+    )
+    run_job(fresh)
+    assert Job.objects.get(pk=job.pk).status == Job.Status.DONE
+
+
+@override_settings(
+    EMAIL_BACKEND="jobs.mail.QueuedEmailBackend",
+    JOBS_EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+)
+def test_queued_email():
+    send_mail("Тема", "Текст", "from@example.com", ["to@example.com"])
+    assert not mail.outbox
+    call_command("run_worker", "--once", stdout=StringIO())
+    assert [message.subject for message in mail.outbox] == ["Тема"]
+
+
+def test_post_image_processed_by_worker(
+        mixer, user, published_location, published_category
+):
+    img_io = BytesIO()
+    Image.new("RGB", (800, 600)).save(img_io, format="JPEG")
+    post = mixer.blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        location=published_location,
+        image=ImageFile(img_io, name="queued.jpg"),
+    )
+    assert Post.objects.get(pk=post.pk).image_renditions == []
+    assert queue_stats()["depth"]["queued"] == 1
+    out = StringIO()
+    call_command("run_worker", "--once", stdout=out)
+    assert "Выполнено задач: 1" in out.getvalue()
+    assert Post.objects.get(pk=post.pk).image_renditions == [320, 640]
+
+
+@override_settings(
+    EMAIL_BACKEND="jobs.mail.QueuedEmailBackend",
+    JOBS_EMAIL_BACKEND="jobs.mail.QueuedEmailBackend",
+)
+def test_queued_email_is_not_requeued():
+    send_mail("Тема", "Текст", "from@example.com", ["to@example.com"])
+    call_command("run_worker", "--once", stdout=StringIO())
+    assert Job.objects.filter(
+        task="jobs.mail.send_queued_email"
+    ).count() == 1, "Убедитесь, что письмо не ставится в очередь повторно."
+
+
+@override_settings(
+    EMAIL_BACKEND="jobs.mail.QueuedEmailBackend",
+    JOBS_EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+)
+def test_queued_email_keeps_attachments_and_headers():
+    message = EmailMessage(
+        "Тема", "Текст", "from@example.com", ["to@example.com"],
+        headers={"X-Blogicum": "1"},
+    )
+    message.attach("data.bin", b"\x00\xff", "application/octet-stream")
+    message.attach("note.txt", "Заметка", "text/plain")
+    message.send()
+    call_command("run_worker", "--once", stdout=StringIO())
+    [sent] = mail.outbox
+    assert sent.extra_headers == {"X-Blogicum": "1"}
+    assert sent.attachments == [
+        ("data.bin", b"\x00\xff", "application/octet-stream"),
+        ("note.txt", "Заметка", "text/plain"),
+    ], "Убедитесь, что вложения не теряются при отправке через очередь."
+
+    message = EmailMessage("MIME", "Текст", to=["to@example.com"])
+    message.attach(MIMEText("Вложение"))
+    message.send()
+    assert [sent.subject for sent in mail.outbox] == ["Тема", "MIME"]
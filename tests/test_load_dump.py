@@ -0,0 +1,115 @@
+import gzip
+import json
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from blog.dumps import iter_json_objects
+from blog.models import Category, Comment, Location, Post, User
+
+pytestmark = [pytest.mark.django_db]
+
+DB_JSON = Path(__file__).resolve().parent.parent / "db.json"
+
+
+def test_iter_json_objects_handles_split_chunks():
+    records = [
+        {"pk": number, "text": "«текст» " * number} for number in range(20)
+    ]
+    source = StringIO(json.dumps(records, ensure_ascii=False, indent=2))
+    assert list(iter_json_objects(source, read_size=7)) == records
+    lines = StringIO("\n".join(json.dumps(record) for record in records))
+    assert list(iter_json_objects(lines, read_size=5)) == records
+
+
+def test_load_dump_loads_blog_models():
+    out = StringIO()
+    call_command("load_dump", str(DB_JSON), "--batch-size", "5", stdout=out)
+    dump = json.loads(DB_JSON.read_text(encoding="utf-8"))
+    for model, label in (
+        (User, "auth.user"),
+        (Category, "blog.category"),
+        (Location, "blog.location"),
+        (Post, "blog.post"),
+    ):
+        assert model.objects.count() == sum(
+            record["model"] == label for record in dump
+        ), f"Убедитесь, что загружены все объекты `{label}`."
+    assert "admin.logentry: пропущено" in out.getvalue()
+    assert "строк/с" in out.getvalue()
+
+
+def test_load_dump_updates_existing_rows(tmp_path, user, published_category):
+    post = Post.objects.create(
+        title="Старый заголовок",
+        text="Текст",
+        pub_date="2023-01-01T00:00:00Z",
+        author=user,
+        category=published_category,
+    )
+    records = [
+        {
+            "model": "blog.post",
+            "pk": post.pk,
+            "fields": {
+                "title": "Новый заголовок",
+                "text": "Текст",
+                "pub_date": "2023-01-01T00:00:00Z",
+                "author": user.pk,
+                "category": published_category.pk,
+                "is_published": True,
+                "created_at": "2023-01-01T00:00:00Z",
+            },
+        },
+        {
+            "model": "blog.comment",
+            "pk": 100,
+            "fields": {
+                "text": "Комментарий",
+                "post": post.pk,
+                "author": user.pk,
+                "created_at": "2023-01-02T00:00:00Z",
+            },
+        },
+    ]
+    path = tmp_path / "dump.jsonl.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as stream:
+        for record in records:
+            stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+    call_command("load_dump", str(path), stdout=StringIO())
+    post.refresh_from_db()
+    assert post.title == "Новый заголовок"
+    assert Comment.objects.filter(pk=100, post=post).exists()
+    assert post.comment_count == 1, (
+        "Убедитесь, что после загрузки пересчитывается число комментариев."
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+def test_load_dump_commits_parents_first():
+    call_command(
+        "load_dump", str(DB_JSON), "--batch-size", "5", stdout=StringIO()
+    )
+    assert Post.objects.exists()
+    assert Post.objects.filter(author__isnull=False).count() == (
+        Post.objects.count()
+    ), "Убедитесь, что авторы загружаются раньше их публикаций."
+
+
+@pytest.mark.django_db(transaction=True)
+def test_load_dump_reports_broken_references(tmp_path):
+    dump = tmp_path / "broken.json"
+    dump.write_text(json.dumps([{
+        "model": "blog.comment",
+        "pk": 1,
+        "fields": {
+            "text": "Комментарий",
+            "post": 999,
+            "author": 999,
+            "created_at": "2023-01-01T00:00:00Z",
+        },
+    }]))
+    with pytest.raises(CommandError, match="blog.comment"):
+        call_command("load_dump", str(dump), stdout=StringIO())
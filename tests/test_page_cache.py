@@ -0,0 +1,93 @@
+import pytest
+
+from blog.models import Comment, Post
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_anonymous_pages_are_cached(
+        client, user_client, post_with_published_location
+):
+    post = post_with_published_location
+    urls = (
+        "/",
+        f"/posts/{post.id}/",
+        f"/category/{post.category.slug}/",
+        f"/profile/{post.author.username}/",
+    )
+    for url in urls:
+        response = client.get(url)
+        assert response.has_header("ETag")
+        assert "public" in response["Cache-Control"]
+        assert "Cookie" in response["Vary"]
+    Post.objects.filter(pk=post.pk).update(title="Без сигналов")
+    for url in urls:
+        assert post.title in client.get(url).content.decode(), (
+            "Убедитесь, что страницы для анонимных пользователей кэшируются."
+        )
+        assert "private" in user_client.get(url)["Cache-Control"]
+    assert "Без сигналов" in user_client.get(
+        f"/posts/{post.id}/"
+    ).content.decode(), (
+        "Убедитесь, что авторизованным пользователям страницы не"
+        " отдаются из кэша."
+    )
+
+
+def test_anonymous_page_cache_purges(
+        client, user_client, post_with_published_location,
+        post_with_another_category
+):
+    post = post_with_published_location
+    other_post_url = f"/posts/{post_with_another_category.id}/"
+    client.get(other_post_url)
+    Post.objects.filter(pk=post_with_another_category.pk).update(
+        title="Без сигналов"
+    )
+    client.get(f"/posts/{post.id}/")
+    user_client.post(
+        f"/posts/{post.id}/add_comment/", data={"text": "Новый комментарий"}
+    )
+    assert "Новый комментарий" in client.get(
+        f"/posts/{post.id}/"
+    ).content.decode(), (
+        "Убедитесь, что кэш страницы публикации сбрасывается при добавлении"
+        " комментария."
+    )
+    assert "Без сигналов" not in client.get(
+        other_post_url
+    ).content.decode(), (
+        "Убедитесь, что изменение публикации сбрасывает кэш только связанных"
+        " с ней страниц."
+    )
+
+    post.category.title = "Переименованная категория"
+    post.category.save()
+    assert "Переименованная категория" in client.get("/").content.decode()
+
+
+def test_cached_anonymous_hit_skips_session(
+        client, post_with_published_location
+):
+    client.get("/")
+    response = client.get("/")
+    assert not response.wsgi_request.session.accessed, (
+        "Убедитесь, что запрос анонима без cookie сессии не обращается"
+        " к хранилищу сессий."
+    )
+
+
+def test_comment_edit_purges_post_page(
+        client, user, user_client, post_with_published_location
+):
+    post = post_with_published_location
+    comment = Comment.objects.create(post=post, author=user, text="Старый")
+    url = f"/posts/{post.id}/"
+    assert "Старый" in client.get(url).content.decode()
+    user_client.post(
+        f"{url}edit_comment/{comment.id}/", data={"text": "Исправленный"}
+    )
+    assert "Исправленный" in client.get(url).content.decode(), (
+        "Убедитесь, что кэш страницы публикации сбрасывается при"
+        " редактировании комментария."
+    )
@@ -0,0 +1,157 @@
+import re
+from datetime import timedelta
+from http import HTTPStatus
+
+import pytest
+from django.core.paginator import Paginator
+from django.db import connection
+from django.template.loader import render_to_string
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from blog.models import Post
+from blog.paginators import CachedCountPaginator
+from conftest import N_PER_PAGE
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _get_cursor(content: str, label: str):
+    match = re.search(
+        rf'href="\?cursor=([\w-]*)">\s*{re.escape(label)}', content
+    )
+    return match.group(1) if match else None
+
+
+def test_keyset_pagination_walks_feed(
+        client, many_posts_with_published_locations
+):
+    expected = sorted(
+        many_posts_with_published_locations,
+        key=lambda post: (post.pub_date, post.id),
+        reverse=True,
+    )
+    seen = []
+    url = "/?cursor="
+    while url:
+        response = client.get(url)
+        assert response.status_code == HTTPStatus.OK, (
+            "Убедитесь, что главная страница с параметром `cursor`"
+            " загружается без ошибок."
+        )
+        page = list(response.context["page_obj"])
+        assert len(page) <= N_PER_PAGE
+        seen.extend(page)
+        cursor = _get_cursor(response.content.decode(), ">>")
+        url = f"/?cursor={cursor}" if cursor else None
+    assert [post.id for post in seen] == [post.id for post in expected], (
+        "Убедитесь, что курсорная пагинация выводит все публикации"
+        " ровно по одному разу в порядке убывания даты публикации."
+    )
+
+    first_page = client.get("/?cursor=")
+    second_page = client.get(
+        f"/?cursor={_get_cursor(first_page.content.decode(), '>>')}"
+    )
+    previous_cursor = _get_cursor(second_page.content.decode(), "<<")
+    response = client.get(f"/?cursor={previous_cursor}")
+    assert [post.id for post in response.context["page_obj"]] == [
+        post.id for post in expected[:N_PER_PAGE]
+    ], "Убедитесь, что ссылка на предыдущую страницу ведёт назад по ленте."
+
+
+def test_keyset_pagination_skips_count(
+        client, many_posts_with_published_locations
+):
+    with CaptureQueriesContext(connection) as queries:
+        client.get("/?cursor=")
+    assert not any(
+        query["sql"].startswith("SELECT COUNT(*)")
+        for query in queries.captured_queries
+    ), "Убедитесь, что курсорная пагинация не подсчитывает число записей."
+
+
+@pytest.mark.parametrize("cursor", ["garbage", "bm98", "%%%"])
+def test_keyset_pagination_invalid_cursor(
+        client, many_posts_with_published_locations, cursor
+):
+    response = client.get("/", {"cursor": cursor})
+    assert response.status_code == HTTPStatus.OK
+    assert len(response.context["page_obj"]) == N_PER_PAGE, (
+        "Убедитесь, что при некорректном курсоре выводится первая страница."
+    )
+
+
+def _count_queries(client, url):
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url)
+    assert response.status_code == HTTPStatus.OK
+    return sum(
+        query["sql"].startswith("SELECT COUNT(*)")
+        for query in queries.captured_queries
+    )
+
+
+def test_feed_count_is_cached(
+        user_client, many_posts_with_published_locations, mixer, user,
+        published_category
+):
+    assert _count_queries(user_client, "/") == 1
+    assert _count_queries(user_client, "/?page=2") == 0, (
+        "Убедитесь, что число публикаций в ленте берётся из кеша."
+    )
+    mixer.blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        pub_date=timezone.now() - timedelta(days=1),
+        is_published=True,
+    )
+    assert _count_queries(user_client, "/") == 1, (
+        "Убедитесь, что кешированное число публикаций сбрасывается"
+        " при изменении ленты."
+    )
+    response = user_client.get("/?page=3")
+    assert response.context["page_obj"].paginator.num_pages == 3
+    assert len(response.context["page_obj"]) == 1
+
+
+def test_feed_page_is_clamped(client, many_posts_with_published_locations):
+    response = client.get("/?page=9999")
+    assert response.context["page_obj"].number == 2, (
+        "Убедитесь, что номер страницы за пределами ленты"
+        " заменяется последней страницей."
+    )
+
+
+def test_cached_count_reaches_every_page(user, published_category):
+    Post.objects.bulk_create(
+        Post(
+            title=f"Публикация {number}",
+            text="Текст",
+            pub_date=timezone.now(),
+            author=user,
+            category=published_category,
+        ) for number in range(120)
+    )
+    paginator = CachedCountPaginator(
+        Post.objects.order_by("pk"), 1, "test-count"
+    )
+    assert paginator.num_pages == 120
+    assert paginator.get_page(120).number == 120, (
+        "Убедитесь, что все страницы ленты остаются доступными."
+    )
+
+
+def test_page_window_is_bounded():
+    page_obj = Paginator(range(10000), N_PER_PAGE).get_page(500)
+    content = render_to_string(
+        "includes/paginator.html", {"page_obj": page_obj}
+    )
+    links = re.findall(r"\?page=(\d+)", content)
+    assert {"1", "498", "499", "501", "502", "1000"} <= set(links)
+    assert len(set(links)) <= 8, (
+        "Убедитесь, что пагинатор выводит ограниченное окно страниц,"
+        " а не ссылку на каждую страницу."
+    )
+    assert content.count("…") == 2
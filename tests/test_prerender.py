@@ -0,0 +1,121 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from pages.errors import not_found_counts
+from pages.prerender import URL_MARKER, load_prerendered
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def prerendered(tmp_path):
+    with override_settings(PAGES_PRERENDER_ROOT=tmp_path):
+        call_command("prerender_pages", stdout=StringIO())
+        yield tmp_path
+    load_prerendered.cache_clear()
+
+
+def test_prerender_writes_hashed_files(prerendered):
+    manifest = json.loads((prerendered / "manifest.json").read_text())
+    assert set(manifest) == {"about", "rules", "403csrf", "404", "500"}
+    for name, filename in manifest.items():
+        assert filename.startswith(f"{name}.") and filename.endswith(".html")
+        assert (prerendered / filename).is_file(), (
+            f"Убедитесь, что страница `{name}` записана в файл."
+        )
+    assert URL_MARKER in (prerendered / manifest["404"]).read_text()
+    assert "Регистрация" in (prerendered / manifest["about"]).read_text(), (
+        "Убедитесь, что страницы рендерятся для анонимного пользователя."
+    )
+
+
+def test_prerendered_page_served_to_anonymous(client, prerendered):
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get("/pages/about/")
+    assert response.status_code == 200
+    assert not response.templates, (
+        "Убедитесь, что анонимному пользователю отдаётся готовый HTML."
+    )
+    assert len(queries) == 0
+    assert "max-age" in response["Cache-Control"]
+    assert "Cookie" in response["Vary"]
+    response = client.get(
+        "/pages/about/", HTTP_IF_NONE_MATCH=response["ETag"]
+    )
+    assert response.status_code == 304
+
+
+def test_authenticated_user_gets_dynamic_page(user_client, prerendered):
+    response = user_client.get("/pages/rules/")
+    assert response.status_code == 200
+    assert "pages/rules.html" in [t.name for t in response.templates], (
+        "Убедитесь, что для пользователя с сессией страница рендерится."
+    )
+
+
+def test_dynamic_page_without_manifest(client, tmp_path):
+    with override_settings(PAGES_PRERENDER_ROOT=tmp_path):
+        load_prerendered.cache_clear()
+        response = client.get("/pages/about/")
+    load_prerendered.cache_clear()
+    assert response.status_code == 200
+    assert "pages/about.html" in [t.name for t in response.templates]
+
+
+def test_not_found_served_without_queries(user_client, prerendered):
+    with CaptureQueriesContext(connection) as queries:
+        response = user_client.get("/no-such-page/?q=<script>")
+    assert response.status_code == 404
+    assert len(queries) == 0, (
+        "Убедитесь, что обработчик 404 не обращается к базе данных."
+    )
+    content = response.content.decode()
+    assert "/no-such-page/" in content
+    assert "<script>" not in content
+    assert URL_MARKER not in content
+
+
+def test_not_found_fallback_without_queries(user_client):
+    with CaptureQueriesContext(connection) as queries:
+        response = user_client.get("/posts/no-such-post/")
+    assert response.status_code == 404
+    assert len(queries) == 0
+    assert "pages/404.html" in [t.name for t in response.templates]
+
+
+def test_not_found_counted_by_prefix(client, caplog):
+    for path in ("/posts/x/", "/posts/y/", "/wp-admin/", "/.env"):
+        client.get(path)
+    counts = not_found_counts()
+    assert counts["posts"] == 2
+    assert counts["*"] == 2, (
+        "Убедитесь, что неизвестные префиксы учитываются в общем счётчике."
+    )
+    assert "wp-admin" not in counts
+    logged = [
+        record.getMessage() for record in caplog.records
+        if record.name == "pages.errors"
+    ]
+    assert logged == [
+        "Страница не найдена: /posts/x/",
+        "Страница не найдена: /wp-admin/",
+    ], "Убедитесь, что 404 логируются не чаще раза в минуту на префикс."
+
+
+def test_csrf_failure_served_without_queries(user, prerendered):
+    client = Client(enforce_csrf_checks=True)
+    client.force_login(user)
+    with CaptureQueriesContext(connection) as queries:
+        response = client.post("/posts/create/", {})
+    assert response.status_code == 403
+    assert len(queries) == 0, (
+        "Убедитесь, что страница ошибки CSRF отдаётся без обращения к базе."
+    )
+    manifest = json.loads((prerendered / "manifest.json").read_text())
+    assert response.content == (prerendered / manifest["403csrf"]).read_bytes()
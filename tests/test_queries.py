@@ -0,0 +1,67 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from conftest import N_PER_FIXTURE
+
+pytestmark = [pytest.mark.django_db]
+
+
+def count_queries(client, url: str) -> int:
+    with CaptureQueriesContext(connection) as queries:
+        client.get(url)
+    return len(queries)
+
+
+def test_post_detail_queries_do_not_grow_with_comments(
+        mixer, user_client, post_with_published_location
+):
+    post = post_with_published_location
+    url = f"/posts/{post.id}/"
+    mixer.cycle(N_PER_FIXTURE).blend("blog.Comment", post=post)
+    few_comments_queries = count_queries(user_client, url)
+    mixer.cycle(N_PER_FIXTURE * 20).blend("blog.Comment", post=post)
+    many_comments_queries = count_queries(user_client, url)
+    assert many_comments_queries == few_comments_queries, (
+        "Убедитесь, что число запросов к БД на странице публикации не"
+        " зависит от количества комментариев."
+    )
+
+
+@pytest.mark.parametrize("client_name", ["client", "user_client"])
+def test_post_detail_loads_post_in_one_query(
+        request, client_name, post_with_published_location
+):
+    view_client = request.getfixturevalue(client_name)
+    with CaptureQueriesContext(connection) as queries:
+        view_client.get(f"/posts/{post_with_published_location.id}/")
+    post_queries = [
+        query["sql"] for query in queries.captured_queries
+        if '"blog_post"."title"' in query["sql"]
+    ]
+    assert len(post_queries) == 1, (
+        "Убедитесь, что публикация на странице поста загружается одним"
+        " запросом к БД."
+    )
+    lazy_loads = [
+        query["sql"] for query in queries.captured_queries
+        if query["sql"].split(" WHERE ")[0].endswith(
+            ('FROM "blog_category"', 'FROM "blog_location"')
+        )
+    ]
+    assert not lazy_loads, (
+        "Убедитесь, что категория и местоположение публикации загружаются"
+        " вместе с публикацией."
+    )
+    assert all(
+        '"auth_user"' in sql for sql in post_queries
+    ), "Убедитесь, что автор публикации загружается вместе с публикацией."
+
+
+def test_post_detail_hides_unpublished_from_others(
+        user_client, another_user_client,
+        unpublished_posts_with_published_locations
+):
+    post = unpublished_posts_with_published_locations[0]
+    assert user_client.get(f"/posts/{post.id}/").status_code == 200
+    assert another_user_client.get(f"/posts/{post.id}/").status_code == 404
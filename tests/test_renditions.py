@@ -0,0 +1,76 @@
+from io import BytesIO, StringIO
+
+import pytest
+from PIL import Image
+from django.core.files.images import ImageFile
+from django.core.management import call_command
+from django.test import override_settings
+
+from blog.models import Post
+from blog.renditions import rendition_name
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture(autouse=True)
+def media_root(tmp_path):
+    with override_settings(MEDIA_ROOT=str(tmp_path)):
+        yield tmp_path
+
+
+def make_image(width: int, height: int) -> ImageFile:
+    img_io = BytesIO()
+    Image.new("RGB", (width, height), color=(73, 109, 137)).save(
+        img_io, format="JPEG"
+    )
+    return ImageFile(img_io, name="big_image.jpg")
+
+
+@pytest.fixture
+def post_with_big_image(mixer, user, published_location, published_category):
+    return mixer.blend(
+        "blog.Post",
+        author=user,
+        location=published_location,
+        category=published_category,
+        image=make_image(800, 600),
+    )
+
+
+def test_renditions_created_on_upload(
+        client, media_root, post_with_big_image
+):
+    post = Post.objects.get(pk=post_with_big_image.pk)
+    assert post.image_renditions == [320, 640], (
+        "Убедитесь, что при загрузке изображения создаются уменьшенные копии"
+        " всех ширин меньше исходной."
+    )
+    for width in post.image_renditions:
+        for extension in ("jpg", "webp"):
+            path = media_root / rendition_name(post.image.name, width, extension)
+            assert path.exists()
+            with Image.open(path) as rendition:
+                assert rendition.width == width
+    content = client.get("/").content.decode()
+    assert 'type="image/webp"' in content
+    assert rendition_name(post.image.url, 320, "webp") + " 320w" in content
+
+
+def test_small_images_are_kept(
+        media_root, post_with_published_location
+):
+    post_with_published_location.refresh_from_db()
+    assert post_with_published_location.image_renditions == []
+    assert len(list(media_root.rglob("*.webp"))) == 0
+
+
+def test_generate_renditions_backfills(
+        media_root, post_with_big_image
+):
+    Post.objects.update(image_renditions=[])
+    for path in media_root.rglob("*_*w.*"):
+        path.unlink()
+    out = StringIO()
+    call_command("generate_renditions", stdout=out)
+    assert "Обработано публикаций: 1" in out.getvalue()
+    assert len(list(media_root.rglob("*.webp"))) == 2
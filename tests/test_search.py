@@ -0,0 +1,138 @@
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+
+from blog.models import Post
+from blog.search import FTS5SearchBackend
+from jobs.models import Job
+
+pytestmark = [pytest.mark.django_db]
+
+DB_JSON = Path(__file__).resolve().parent.parent / "db.json"
+
+
+@pytest.fixture
+def posts(mixer, user, published_category, published_location):
+    def make(title, text):
+        return mixer.blend(
+            "blog.Post",
+            title=title,
+            text=text,
+            author=user,
+            category=published_category,
+            location=published_location,
+            is_published=True,
+        )
+
+    return (
+        make("Ёжик в тумане", "Про лошадку"),
+        make("Прогулка", "Ёжики живут в лесу, ёжик любит туман"),
+        make("Совсем другое", "Про котов"),
+    )
+
+
+def search_titles(client, query):
+    response = client.get("/search/", {"q": query})
+    assert response.status_code == 200
+    return [post.title for post in response.context["page_obj"]]
+
+
+@pytest.mark.parametrize(
+    "backend",
+    ["blog.search.FTS5SearchBackend", "blog.search.SimpleSearchBackend"],
+)
+def test_search_finds_published_posts(client, posts, backend):
+    with override_settings(BLOG_SEARCH_BACKEND=backend):
+        titles = search_titles(client, "туман")
+        assert set(titles) == {"Ёжик в тумане", "Прогулка"}, (
+            "Убедитесь, что поиск находит публикации по заголовку и тексту."
+        )
+        assert search_titles(client, "") == []
+        assert search_titles(client, '"(*:^') == []
+
+
+def test_search_ignores_yo(client, posts):
+    assert set(search_titles(client, "ежик")) == {"Ёжик в тумане", "Прогулка"}
+
+
+def test_search_ranks_title_matches_first(client, posts):
+    assert search_titles(client, "ёжик туман")[0] == "Ёжик в тумане"
+
+
+def test_search_index_follows_changes(client, posts):
+    first, _, last = posts
+    last.title = "Ёжик вернулся"
+    last.save()
+    first.delete()
+    assert search_titles(client, "ёжик") == ["Ёжик вернулся", "Прогулка"]
+    Post.objects.filter(pk=last.pk).update(is_published=False)
+    assert search_titles(client, "ёжик") == ["Прогулка"], (
+        "Убедитесь, что в результаты поиска не попадают снятые публикации."
+    )
+
+
+def test_search_uses_index(client, posts):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "EXPLAIN QUERY PLAN SELECT rowid FROM blog_post_fts "
+            "WHERE blog_post_fts MATCH %s",
+            ['"ёжик"*'],
+        )
+        plan = " ".join(str(row[-1]) for row in cursor.fetchall())
+    assert "VIRTUAL TABLE INDEX" in plan
+
+
+def test_rebuild_search_index(client, posts):
+    with connection.cursor() as cursor:
+        cursor.execute("DELETE FROM blog_post_fts")
+    assert search_titles(client, "ёжик") == []
+    out = StringIO()
+    call_command("rebuild_search_index", stdout=out)
+    assert "Проиндексировано публикаций: 3" in out.getvalue()
+    assert len(search_titles(client, "ёжик")) == 2
+
+
+def test_admin_search_uses_index(admin_client, posts):
+    response = admin_client.get("/admin/blog/post/", {"q": "котов"})
+    assert [post.title for post in response.context["cl"].result_list] == [
+        "Совсем другое"
+    ]
+
+
+def test_bulk_loaded_posts_are_indexed():
+    backend = FTS5SearchBackend()
+    call_command(
+        "generate_data", "--users", "2", "--categories", "1",
+        "--locations", "1", "--posts", "20", "--comments", "0",
+        stdout=StringIO()
+    )
+    assert backend.search(Post.objects.all(), "Публикация").count() == 20, (
+        "Убедитесь, что сгенерированные публикации попадают в индекс поиска."
+    )
+    call_command("load_dump", str(DB_JSON), stdout=StringIO())
+    assert backend.search(Post.objects.all(), "Блины").exists(), (
+        "Убедитесь, что загруженные из дампа публикации попадают в индекс"
+        " поиска."
+    )
+
+
+@override_settings(JOBS_EAGER=False)
+def test_author_reindexed_only_on_rename(client, posts):
+    author = posts[0].author
+    author.first_name = "Иван"
+    author.save()
+    assert not Job.objects.exists(), (
+        "Убедитесь, что публикации автора переиндексируются только при"
+        " смене имени пользователя."
+    )
+    author.username = "переименованный"
+    author.save()
+    job = Job.objects.get()
+    assert job.task == "blog.tasks.index_author_posts"
+    assert search_titles(client, "переименованный") == []
+    call_command("run_worker", "--once", stdout=StringIO())
+    assert len(search_titles(client, "переименованный")) == 3
@@ -0,0 +1,46 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.template import engines
+from django.test import override_settings
+
+from blog.warmup import warm_templates
+
+
+def test_warm_templates_covers_project_templates():
+    timings = warm_templates()
+    for name in (
+        "base.html",
+        "blog/index.html",
+        "includes/post_card.html",
+        "pages/404.html",
+    ):
+        assert name in timings, f"Убедитесь, что шаблон `{name}` прогревается."
+    assert not any(name.startswith("admin/base") for name in timings), (
+        "Убедитесь, что прогреваются только шаблоны проекта."
+    )
+
+
+def test_warm_templates_command():
+    out = StringIO()
+    call_command("warm_templates", stdout=out)
+    assert "blog/index.html" in out.getvalue()
+    assert "Шаблонов:" in out.getvalue()
+
+
+def test_cached_loader_is_warmed():
+    loaders = [(
+        "django.template.loaders.cached.Loader",
+        ["django.template.loaders.filesystem.Loader"],
+    )]
+    base = engines["django"]
+    with override_settings(TEMPLATES=[{
+        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "DIRS": base.engine.dirs,
+        "OPTIONS": {"loaders": loaders},
+    }]):
+        warm_templates()
+        cached_loader = engines["django"].engine.template_loaders[0]
+        assert "blog/index.html" in {
+            key.split("-")[0] for key in cached_loader.get_template_cache
+        }